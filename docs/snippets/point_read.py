@@ -1,7 +1,6 @@
 """Read points from a CopickPicks object."""
 
 import copick
-import numpy as np
 
 # Initialize the root object from a configuration file
 root = copick.from_file("path/to/config.json")
@@ -12,7 +11,5 @@ run = root.runs[0]
 # Get 'proteasome' picks of user 'alice'
 picks = run.get_picks(object_name="proteasome", user_id="alice")[0]
 
-# Get the points from the picks
-point_arr = np.ndarray((len(picks.points), 3))
-for idx, pt in enumerate(picks.points):
-    point_arr[idx, :] = [pt.location.x, pt.location.y, pt.location.z]
+# Get the points (N, [x, y, z]) and transforms (N, 4, 4) from the picks as numpy arrays
+point_arr, transform_arr = picks.numpy()
@@ -83,9 +83,9 @@ def run():
     # Imports
     from typing import List, Sequence
 
-    import copick
     import numpy as np
-    import zarr
+
+    import copick
     from copick.models import CopickLocation, CopickPoint
 
     # Parse arguments
@@ -129,7 +129,7 @@ def run():
         # Get the physical tomogram dimensions
         vs = run.get_voxel_spacing(voxel_spacing)
         tomo = vs.get_tomogram(tomo_type)
-        pixel_max_dim = zarr.open(tomo.zarr())["0"].shape[::-1]
+        pixel_max_dim = tomo.data("0").shape[::-1]
         max_dim = np.array([d * voxel_spacing for d in pixel_max_dim])
 
         # If picks of the same type already exist, we will get and overwrite them
@@ -1,8 +1,6 @@
 """Read a tomogram from a zarr-store into a numpy array."""
 
 import copick
-import numpy as np
-import zarr
 
 # Initialize the root object from a configuration file
 root = copick.from_file("path/to/config.json")
@@ -18,9 +16,15 @@ tomogram = voxel_spacing.get_tomogram("wbp")
 
 # Read the tomogram from its zarr-store
 # Scale "0" is the unbinned tomogram
-zarr_array = zarr.open(tomogram.zarr())["0"]
-tomogram_data = np.array(zarr_array)
+tomogram_data = tomogram.numpy("0")
 
 # Scale "1" is the tomogram binned by 2
-zarr_array_bin2 = zarr.open(tomogram.zarr())["1"]
-tomogram_data_bin2 = np.array(zarr_array_bin2)
+tomogram_data_bin2 = tomogram.numpy("1")
+
+# Read only a subvolume, without loading the full tomogram
+# Only the chunks overlapping the subvolume are read from the zarr-store
+tomogram_array = tomogram.data("0")
+subvolume = tomogram_array[100:228, 100:228, 100:228]
+
+# Read the tomogram as float16, casting each chunk as it is decoded
+tomogram_data_fp16 = tomogram.numpy("0", dtype="float16")
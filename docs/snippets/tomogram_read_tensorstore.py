@@ -0,0 +1,21 @@
+"""Read a tomogram subvolume using TensorStore (requires `pip install copick[tensorstore]`)."""
+
+import copick
+
+# Initialize the root object from a configuration file
+root = copick.from_file("path/to/config.json")
+
+# Get the run named 'TS_001'
+run = root.get_run("TS_001")
+
+# Get the voxel spacing with a resolution of 10 angstroms
+voxel_spacing = run.get_voxel_spacing(10.000)
+
+# Get the tomogram named 'wbp'
+tomogram = voxel_spacing.get_tomogram("wbp")
+
+# Open scale "0" of the tomogram with TensorStore, no data is read yet
+tomogram_store = tomogram.tensorstore("0")
+
+# Read a subvolume, fetching and decoding the overlapping chunks concurrently
+subvolume = tomogram_store[100:228, 100:228, 100:228].read().result()
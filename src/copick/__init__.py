@@ -1,11 +1,30 @@
 __version__ = "0.8.1"
 
-from copick.ops.open import from_czcdp_datasets, from_file, from_string
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from copick.ops.open import clear_config_cache, from_czcdp_datasets, from_file, from_string
 
 __all__ = [
     "from_file",
     "from_string",
     "from_czcdp_datasets",
     "from_string",
+    "clear_config_cache",
     "__version__",
 ]
+
+_LAZY_ATTRIBUTES = ("from_file", "from_string", "from_czcdp_datasets", "clear_config_cache")
+
+
+def __getattr__(name: str):
+    # The entry points are imported on first access, so importing copick (e.g. for a CLI's --help) does not import
+    # the storage backends and array libraries.
+    if name in _LAZY_ATTRIBUTES:
+        import copick.ops.open
+
+        value = getattr(copick.ops.open, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,6 @@ import json
 
 import click
 
-from copick.impl.cryoet_data_portal import CopickConfigCDP
-from copick.impl.filesystem import CopickConfigFSSpec
-from copick.models import PickableObject
-
 LOCAL_OVERLAY = {
     "overlay_root": "local:///path/to/copick_project/",
     "overlay_fs_args": {
@@ -95,30 +91,30 @@ STATIC_LOCATIONS = {
 }
 
 OBJECTS = [
-    PickableObject(
-        name="ribosome",
-        is_particle=True,
-        identifier="GO:0022626",
-        label=1,
-        color=[0, 117, 220, 255],
-        radius=150,
-    ),
-    PickableObject(
-        name="atpase",
-        is_particle=True,
-        identifier="GO:0045259",
-        label=2,
-        color=[251, 192, 147, 255],
-        radius=150,
-    ),
-    PickableObject(
-        name="membrane",
-        is_particle=False,
-        identifier="GO:0016020",
-        label=3,
-        color=[200, 200, 200, 255],
-        radius=10,
-    ),
+    {
+        "name": "ribosome",
+        "is_particle": True,
+        "identifier": "GO:0022626",
+        "label": 1,
+        "color": [0, 117, 220, 255],
+        "radius": 150,
+    },
+    {
+        "name": "atpase",
+        "is_particle": True,
+        "identifier": "GO:0045259",
+        "label": 2,
+        "color": [251, 192, 147, 255],
+        "radius": 150,
+    },
+    {
+        "name": "membrane",
+        "is_particle": False,
+        "identifier": "GO:0016020",
+        "label": 3,
+        "color": [200, 200, 200, 255],
+        "radius": 10,
+    },
 ]
 
 
@@ -131,6 +127,10 @@ OBJECTS = [
 )
 @click.pass_context
 def create(ctx, outdir: str = "docs/templates/configs/") -> None:
+    # Deferred, so that --help does not pay for importing the data portal client and the array libraries.
+    from copick.impl.cryoet_data_portal import CopickConfigCDP
+    from copick.impl.filesystem import CopickConfigFSSpec
+
     # Overlay only
     for overlay_type, overlay in OVERLAY_LOCATIONS.items():
         config = CopickConfigFSSpec(
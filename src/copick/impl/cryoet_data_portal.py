@@ -36,6 +36,7 @@ from copick.models import (
     CopickVoxelSpacingMeta,
     PickableObject,
 )
+from copick.util.storage import read_only_store
 
 
 def camel(s: str) -> str:
@@ -211,20 +212,29 @@ class CopickPicksCDP(CopickPicksOverlay):
             af = cdp.AnnotationFile.get_by_id(client, self.meta.portal_annotation_file_id)
             return CopickPicksFileCDP.from_portal(af)
         else:
-            if not self.fs.exists(self.path):
-                raise FileNotFoundError(f"File not found: {self.path}")
+            return CopickPicksFileCDP.model_validate_json(self._load_json())
 
-            with self.fs.open(self.path, "r") as f:
-                data = json.load(f)
+    def _load_json(self) -> Optional[bytes]:
+        # Portal picks are not stored as copick JSON
+        if self.read_only:
+            return None
+
+        if not self.fs.exists(self.path):
+            raise FileNotFoundError(f"File not found: {self.path}")
 
-            return CopickPicksFileCDP(**data)
+        return self.fs.cat_file(self.path)
 
     def _store(self) -> None:
+        self._store_json(self.meta.model_dump_json(indent=4))
+
+    def _store_json(self, data: str) -> bool:
         if not self.fs.exists(self.directory):
             self.fs.makedirs(self.directory, exist_ok=True)
 
         with self.fs.open(self.path, "w") as f:
-            json.dump(self.meta.dict(), f, indent=4)
+            f.write(data)
+
+        return True
 
 
 class CopickMeshCDP(CopickMeshOverlay):
@@ -330,13 +340,12 @@ class CopickSegmentationCDP(CopickSegmentationOverlay):
     def portal_segmentation_id(self) -> int:
         return self.meta.portal_annotation_file_id
 
-    def zarr(self) -> zarr.storage.FSStore:
+    def zarr(self, cache_size: Optional[int] = None) -> zarr.storage.BaseStore:
         if self.read_only:
-            mode = "r"
-            create = False
-        else:
-            mode = "w"
-            create = not self.fs.exists(self.path)
+            return read_only_store(self.path, self.fs, cache_size)
+
+        mode = "w"
+        create = not self.fs.exists(self.path)
 
         return zarr.storage.FSStore(
             self.path,
@@ -452,17 +461,14 @@ class CopickTomogramCDP(CopickTomogramOverlay):
             for ft in feature_types
         ]
 
-    def zarr(self) -> zarr.storage.FSStore:
+    def zarr(self, cache_size: Optional[int] = None) -> zarr.storage.BaseStore:
         if self.read_only:
-            fs = s3fs.S3FileSystem(anon=True)
-            path = self.meta.portal_tomo_path
-            mode = "r"
-            create = False
-        else:
-            fs = self.fs_overlay
-            path = self.overlay_path
-            mode = "w"
-            create = not fs.exists(path)
+            return read_only_store(self.meta.portal_tomo_path, s3fs.S3FileSystem(anon=True), cache_size)
+
+        fs = self.fs_overlay
+        path = self.overlay_path
+        mode = "w"
+        create = not fs.exists(path)
 
         return zarr.storage.FSStore(
             path,
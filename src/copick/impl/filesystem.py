@@ -31,6 +31,33 @@ from copick.models import (
     CopickVoxelSpacingMeta,
     PickableObject,
 )
+from copick.util.storage import read_only_store
+
+
+def _is_dir(details: Dict[str, Any]) -> bool:
+    return (
+        (details.get("type", "") == "directory")
+        or (details.get("type", "") == "other" and details.get("islink", False))
+        or (details.get("type", "") == "link")
+    )
+
+
+def _list_dirs(fs: AbstractFileSystem, path: str) -> List[str]:
+    """List the subdirectories of a directory with a single listing request.
+
+    Args:
+        fs: The filesystem to list.
+        path: The directory to list.
+
+    Returns:
+        List[str]: The paths of the subdirectories, or an empty list if the directory does not exist.
+    """
+    try:
+        entries = fs.ls(path, detail=True)
+    except FileNotFoundError:
+        return []
+
+    return [e["name"].rstrip("/") for e in entries if _is_dir(e)]
 
 
 class CopickConfigFSSpec(CopickConfig):
@@ -81,20 +108,25 @@ class CopickPicksFSSpec(CopickPicksOverlay):
         return self.run.fs_static if self.read_only else self.run.fs_overlay
 
     def _load(self) -> CopickPicksFile:
+        return CopickPicksFile.model_validate_json(self._load_json())
+
+    def _load_json(self) -> bytes:
         if not self.fs.exists(self.path):
             raise FileNotFoundError(f"File not found: {self.path}")
 
-        with self.fs.open(self.path, "r") as f:
-            data = json.load(f)
-
-        return CopickPicksFile(**data)
+        return self.fs.cat_file(self.path)
 
     def _store(self) -> None:
+        self._store_json(self.meta.model_dump_json(indent=4))
+
+    def _store_json(self, data: str) -> bool:
         if not self.fs.exists(self.directory):
             self.fs.makedirs(self.directory, exist_ok=True)
 
         with self.fs.open(self.path, "w") as f:
-            json.dump(self.meta.dict(), f, indent=4)
+            f.write(data)
+
+        return True
 
 
 class CopickMeshFSSpec(CopickMeshOverlay):
@@ -172,18 +204,21 @@ class CopickSegmentationFSSpec(CopickSegmentationOverlay):
     def fs(self) -> AbstractFileSystem:
         return self.run.fs_static if self.read_only else self.run.fs_overlay
 
-    def zarr(self) -> zarr.storage.FSStore:
+    def zarr(self, cache_size: Optional[int] = None) -> zarr.storage.BaseStore:
         """Get the zarr store for the segmentation object.
 
+        Args:
+            cache_size: Size of the chunk cache in bytes if the store is read-only and remote. Default is the cache
+                shared by all remote stores, 0 disables caching.
+
         Returns:
-            zarr.storage.FSStore: The zarr store for the segmentation object.
+            zarr.storage.BaseStore: The zarr store for the segmentation object. Read-only local stores are memory-mapped.
         """
         if self.read_only:
-            mode = "r"
-            create = False
-        else:
-            mode = "w"
-            create = not self.fs.exists(self.path)
+            return read_only_store(self.path, self.fs, cache_size)
+
+        mode = "w"
+        create = not self.fs.exists(self.path)
 
         return zarr.storage.FSStore(
             self.path,
@@ -216,18 +251,17 @@ class CopickFeaturesFSSpec(CopickFeaturesOverlay):
     def fs(self) -> AbstractFileSystem:
         return self.tomogram.fs_static if self.read_only else self.tomogram.fs_overlay
 
-    def zarr(self) -> zarr.storage.FSStore:
+    def zarr(self) -> zarr.storage.BaseStore:
         """Get the zarr store for the features object.
 
         Returns:
-            zarr.storage.FSStore: The zarr store for the features object.
+            zarr.storage.BaseStore: The zarr store for the features object. Read-only local stores are memory-mapped.
         """
         if self.read_only:
-            mode = "r"
-            create = False
-        else:
-            mode = "w"
-            create = not self.fs.exists(self.path)
+            return read_only_store(self.path, self.fs)
+
+        mode = "w"
+        create = not self.fs.exists(self.path)
 
         return zarr.storage.FSStore(
             self.path,
@@ -290,8 +324,8 @@ class CopickTomogramFSSpec(CopickTomogramOverlay):
             return []
 
         feat_loc = self.static_path.replace(".zarr", "_")
-        paths = self.fs_static.glob(feat_loc + "*_features.zarr") + self.fs_static.glob(feat_loc + "*_features.zarr/")
-        paths = [p.rstrip("/") for p in paths if self.fs_static.isdir(p)]
+        paths = _list_dirs(self.fs_static, self.voxel_spacing.static_path)
+        paths = [p for p in paths if p.startswith(feat_loc) and p.endswith("_features.zarr")]
         feature_types = [n.replace(feat_loc, "").replace("_features.zarr", "") for n in paths]
         # Remove any hidden files?
         feature_types = [ft for ft in feature_types if not ft.startswith(".")]
@@ -312,8 +346,8 @@ class CopickTomogramFSSpec(CopickTomogramOverlay):
 
     def _query_overlay_features(self) -> List[CopickFeaturesFSSpec]:
         feat_loc = self.overlay_path.replace(".zarr", "_")
-        paths = self.fs_overlay.glob(feat_loc + "*_features.zarr") + self.fs_overlay.glob(feat_loc + "*_features.zarr/")
-        paths = [p.rstrip("/") for p in paths if self.fs_overlay.isdir(p)]
+        paths = _list_dirs(self.fs_overlay, self.voxel_spacing.overlay_path)
+        paths = [p for p in paths if p.startswith(feat_loc) and p.endswith("_features.zarr")]
         feature_types = [n.replace(feat_loc, "").replace("_features.zarr", "") for n in paths]
         # Remove any hidden files?
         feature_types = [ft for ft in feature_types if not ft.startswith(".")]
@@ -332,22 +366,23 @@ class CopickTomogramFSSpec(CopickTomogramOverlay):
             for ft in feature_types
         ]
 
-    def zarr(self) -> zarr.storage.FSStore:
+    def zarr(self, cache_size: Optional[int] = None) -> zarr.storage.BaseStore:
         """Get the zarr store for the tomogram object.
 
+        Args:
+            cache_size: Size of the chunk cache in bytes if the store is read-only and remote. Default is the cache
+                shared by all remote stores, 0 disables caching.
+
         Returns:
-            zarr.storage.FSStore: The zarr store for the tomogram object.
+            zarr.storage.BaseStore: The zarr store for the tomogram object. Read-only local stores are memory-mapped.
         """
         if self.read_only:
-            fs = self.fs_static
-            path = self.static_path
-            mode = "r"
-            create = False
-        else:
-            fs = self.fs_overlay
-            path = self.overlay_path
-            mode = "w"
-            create = not fs.exists(path)
+            return read_only_store(self.static_path, self.fs_static, cache_size)
+
+        fs = self.fs_overlay
+        path = self.overlay_path
+        mode = "w"
+        create = not fs.exists(path)
 
         return zarr.storage.FSStore(
             path,
@@ -401,8 +436,7 @@ class CopickVoxelSpacingFSSpec(CopickVoxelSpacingOverlay):
             return []
 
         tomo_loc = f"{self.static_path}/"
-        paths = self.fs_static.glob(tomo_loc + "*.zarr") + self.fs_static.glob(tomo_loc + "*.zarr/")
-        paths = [p.rstrip("/") for p in paths if self.fs_static.isdir(p)]
+        paths = [p for p in _list_dirs(self.fs_static, self.static_path) if p.endswith(".zarr")]
         tomo_types = [n.replace(tomo_loc, "").replace(".zarr", "") for n in paths]
         tomo_types = [t for t in tomo_types if "features" not in t]
         # Remove any hidden files?
@@ -421,8 +455,7 @@ class CopickVoxelSpacingFSSpec(CopickVoxelSpacingOverlay):
 
     def _query_overlay_tomograms(self) -> List[CopickTomogramFSSpec]:
         tomo_loc = f"{self.overlay_path}/"
-        paths = self.fs_overlay.glob(tomo_loc + "*.zarr") + self.fs_overlay.glob(tomo_loc + "*.zarr/")
-        paths = [p.rstrip("/") for p in paths if self.fs_overlay.isdir(p)]
+        paths = [p for p in _list_dirs(self.fs_overlay, self.overlay_path) if p.endswith(".zarr")]
         tomo_types = [n.replace(tomo_loc, "").replace(".zarr", "") for n in paths]
         tomo_types = [t for t in tomo_types if "features" not in t]
         # Remove any hidden files?
@@ -514,8 +547,7 @@ class CopickRunFSSpec(CopickRunOverlay):
             return []
 
         static_vs_loc = f"{self.static_path}/VoxelSpacing"
-        spaths = set(self.fs_static.glob(static_vs_loc + "*") + self.fs_static.glob(static_vs_loc + "*/"))
-        spaths = [p.rstrip("/") for p in spaths]
+        spaths = [p for p in _list_dirs(self.fs_static, self.static_path) if p.startswith(static_vs_loc)]
         spacings = [float(p.replace(f"{static_vs_loc}", "")) for p in spaths]
 
         return [
@@ -528,8 +560,7 @@ class CopickRunFSSpec(CopickRunOverlay):
 
     def _query_overlay_voxel_spacings(self) -> List[CopickVoxelSpacingFSSpec]:
         overlay_vs_loc = f"{self.overlay_path}/VoxelSpacing"
-        opaths = set(self.fs_overlay.glob(overlay_vs_loc + "*") + self.fs_overlay.glob(overlay_vs_loc + "*/"))
-        opaths = [p.rstrip("/") for p in opaths]
+        opaths = [p for p in _list_dirs(self.fs_overlay, self.overlay_path) if p.startswith(overlay_vs_loc)]
         spacings = [float(p.replace(f"{overlay_vs_loc}", "")) for p in opaths]
 
         return [
@@ -659,8 +690,7 @@ class CopickRunFSSpec(CopickRunOverlay):
             return []
 
         seg_loc = f"{self.static_path}/Segmentations/"
-        paths = self.fs_static.glob(seg_loc + "*.zarr") + self.fs_static.glob(seg_loc + "*.zarr/")
-        paths = [p.rstrip("/") for p in paths if self.fs_static.isdir(p)]
+        paths = [p for p in _list_dirs(self.fs_static, seg_loc) if p.endswith(".zarr")]
         names = [n.replace(seg_loc, "").replace(".zarr", "") for n in paths]
         # Remove any hidden files?
         names = [n for n in names if not n.startswith(".")]
@@ -705,8 +735,7 @@ class CopickRunFSSpec(CopickRunOverlay):
 
     def _query_overlay_segmentations(self) -> List[CopickSegmentationFSSpec]:
         seg_loc = f"{self.overlay_path}/Segmentations/"
-        paths = self.fs_overlay.glob(seg_loc + "*.zarr") + self.fs_overlay.glob(seg_loc + "*.zarr/")
-        paths = [p.rstrip("/") for p in paths if self.fs_overlay.isdir(p)]
+        paths = [p for p in _list_dirs(self.fs_overlay, seg_loc) if p.endswith(".zarr")]
         names = [n.replace(seg_loc, "").replace(".zarr", "") for n in paths]
         # Remove any hidden files?
         names = [n for n in names if not n.startswith(".")]
@@ -793,11 +822,12 @@ class CopickObjectFSSpec(CopickObjectOverlay):
     def fs(self) -> AbstractFileSystem:
         return self.root.fs_static
 
-    def zarr(self) -> Union[None, zarr.storage.FSStore]:
+    def zarr(self) -> Union[None, zarr.storage.BaseStore]:
         """Get the zarr store for the object.
 
         Returns:
-            Union[None, zarr.storage.FSStore]: The zarr store for the object, or None if the object is not a particle.
+            Union[None, zarr.storage.BaseStore]: The zarr store for the object, or None if the object is not a particle.
+                Read-only local stores are memory-mapped.
         """
         if not self.is_particle:
             return None
@@ -806,11 +836,10 @@ class CopickObjectFSSpec(CopickObjectOverlay):
             return None
 
         if self.read_only:
-            mode = "r"
-            create = False
-        else:
-            mode = "w"
-            create = not self.fs.exists(self.path)
+            return read_only_store(self.path, self.fs)
+
+        mode = "w"
+        create = not self.fs.exists(self.path)
 
         return zarr.storage.FSStore(
             self.path,
@@ -882,13 +911,7 @@ class CopickRootFSSpec(CopickRoot):
         # Query location
         run_dir = f"{root}/ExperimentRuns/"
         paths = fs.glob(run_dir + "**", maxdepth=1, detail=True)
-        names = [
-            p.rstrip("/").replace(run_dir, "")
-            for p, details in paths.items()
-            if (details.get("type", "") == "directory")
-            or (details.get("type", "") == "other" and details.get("islink", False))
-            or (details.get("type", "") == "link")
-        ]
+        names = [p.rstrip("/").replace(run_dir, "") for p, details in paths.items() if _is_dir(details)]
 
         # Remove any hidden files
         names = [n for n in names if not n.startswith(".") and n != f"{root}/ExperimentRuns"]
@@ -1,5 +1,6 @@
 from typing import List, Optional
 
+import numpy as np
 from trimesh.parent import Geometry
 
 from copick.models import (
@@ -38,6 +39,12 @@ class CopickPicksOverlay(CopickPicks):
             raise PermissionError("Cannot store picks in a read-only source.")
         self._store()
 
+    def from_numpy(self, positions: np.ndarray, transforms: Optional[np.ndarray] = None) -> None:
+        """Set and store the points from numpy arrays, making sure the source is writable."""
+        if self.read_only:
+            raise PermissionError("Cannot store picks in a read-only source.")
+        super().from_numpy(positions, transforms)
+
 
 class CopickMeshOverlay(CopickMesh):
     """CopickMesh class that keeps track of whether the mesh is read-only.
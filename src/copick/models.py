@@ -1,5 +1,6 @@
+import concurrent.futures
 import json
-from typing import Dict, List, Literal, MutableMapping, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Dict, List, Literal, MutableMapping, Optional, Tuple, Type, Union
 
 import numpy as np
 import trimesh
@@ -7,7 +8,26 @@ import zarr
 from pydantic import AliasChoices, BaseModel, Field, field_validator
 from trimesh.parent import Geometry
 
-from copick.util.ome import fits_in_memory, segmentation_pyramid, volume_pyramid, write_ome_zarr_3d
+from copick.ops.extract import extract_subvolumes
+from copick.util.gpu import read_cupy
+from copick.util.ome import (
+    DEFAULT_COMPRESSOR,
+    fits_in_memory,
+    read_chunks,
+    segmentation_pyramid,
+    volume_pyramid,
+    write_ome_zarr_3d,
+)
+from copick.util.storage import open_group
+from copick.util.tensorstore import open_tensorstore
+
+# Shared by all roots, so prefetching many projects doesn't start a thread per project.
+_prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="copick-prefetch")
+
+if TYPE_CHECKING:
+    from cupy import ndarray
+    from numcodecs.abc import Codec
+    from tensorstore import TensorStore
 
 
 class PickableObject(BaseModel):
@@ -113,6 +133,10 @@ class CopickLocation(BaseModel):
     y: float
     z: float
 
+    model_config = {
+        "ser_json_inf_nan": "constants",
+    }
+
 
 class CopickPoint(BaseModel):
     """Point in 3D space with an associated orientation, score value and instance ID.
@@ -136,16 +160,17 @@ class CopickPoint(BaseModel):
 
     model_config = {
         "arbitrary_types_allowed": True,
+        "ser_json_inf_nan": "constants",
     }
 
     @field_validator("transformation_")
     @classmethod
     def validate_transformation(cls, v) -> List[List[float]]:
         """Validate the transformation matrix."""
-        arr = np.array(v)
-        assert arr.shape == (4, 4), "transformation must be a 4x4 matrix."
-        assert arr[3, 3] == 1.0, "Last element of transformation matrix must be 1.0."
-        assert np.allclose(arr[3, :], [0.0, 0.0, 0.0, 1.0]), "Last row of transformation matrix must be [0, 0, 0, 1]."
+        # Plain Python checks, this runs once per point when loading picks.
+        assert len(v) == 4 and all(len(row) == 4 for row in v), "transformation must be a 4x4 matrix."
+        assert v[3][3] == 1.0, "Last element of transformation matrix must be 1.0."
+        assert all(abs(e) <= 1e-8 for e in v[3][:3]), "Last row of transformation matrix must be [0, 0, 0, 1]."
         return v
 
     @property
@@ -192,6 +217,9 @@ class CopickObject:
         self.meta = meta
         self.root = root
 
+        self._group: Optional["zarr.Group"] = None
+        """Cached Zarr-group of the object's map."""
+
     def __repr__(self):
         label = self.label if self.label is not None else "None"
         color = self.color if self.color is not None else "None"
@@ -250,12 +278,41 @@ class CopickObject:
 
         raise NotImplementedError("zarr method must be implemented for particle objects.")
 
+    def _open_group(self) -> Union[None, "zarr.Group"]:
+        """Open the Zarr-group of this object's map for reading. The group and its metadata are cached, so repeated
+        accesses don't parse the metadata again. Writing the map with `from_numpy` drops the cached group."""
+        if self._group is None:
+            loc = self.zarr()
+            if loc is None:
+                return None
+            self._group = open_group(loc)
+
+        return self._group
+
+    def data(self, zarr_group: str = "0", dtype: Optional[np.dtype] = None) -> Union[None, "zarr.Array"]:
+        """Returns the Zarr-Array for this object without reading it. Chunks are only read when the array is indexed.
+
+        Args:
+            zarr_group: Zarr group to access.
+            dtype: Data type the chunks are cast to while reading. Default is the stored data type.
+
+        Returns:
+            zarr.Array: The object as a lazy zarr array, or None if the object has no associated map.
+        """
+        group = self._open_group()
+        if group is None:
+            return None
+
+        array = group[zarr_group]
+        return array if dtype is None else array.astype(dtype)
+
     def numpy(
         self,
         zarr_group: str = "0",
         x: slice = slice(None, None),
         y: slice = slice(None, None),
         z: slice = slice(None, None),
+        dtype: Optional[np.dtype] = None,
     ) -> Union[None, np.ndarray]:
         """Returns the content of the Zarr-File for this object as a numpy array. Multiscale group and slices are
         supported.
@@ -265,28 +322,33 @@ class CopickObject:
             x: Slice for the x-axis.
             y: Slice for the y-axis.
             z: Slice for the z-axis.
+            dtype: Data type of the returned array. Chunks are cast as they are decoded, so no full-size
+                intermediate of the stored type is created. Default is the stored data type.
 
         Returns:
             np.ndarray: The object as a numpy array.
         """
 
-        loc = self.zarr()
-        if loc is None:
+        group = self._open_group()
+        if group is None:
             return None
 
-        group = zarr.open(loc)[zarr_group]
+        group = group[zarr_group]
+        if dtype is not None:
+            group = group.astype(dtype)
 
         fits, req, avail = fits_in_memory(group, (x, y, z))
         if not fits:
             raise ValueError(f"Requested region does not fit in memory. Requested: {req}, Available: {avail}.")
 
-        return group[z, y, x]
+        return read_chunks(group, (z, y, x))
 
     def from_numpy(
         self,
         data: np.ndarray,
         voxel_size: float,
         dtype: Optional[np.dtype] = np.float32,
+        compressor: Optional["Codec"] = DEFAULT_COMPRESSOR,
     ) -> None:
         """Set the object from a numpy array.
 
@@ -294,11 +356,13 @@ class CopickObject:
             data: The segmentation as a numpy array.
             voxel_size: Voxel size of the object.
             dtype: Data type of the segmentation. Default is `np.float32`.
+            compressor: Compressor for the chunks, None disables compression. Default is Blosc LZ4 with byte shuffling.
         """
         loc = self.zarr()
 
         pyramid = volume_pyramid(data, voxel_size, 1, dtype=dtype)
-        write_ome_zarr_3d(loc, pyramid)
+        write_ome_zarr_3d(loc, pyramid, compressor=compressor)
+        self._group = None
 
     def set_region(
         self,
@@ -340,6 +404,7 @@ class CopickRoot:
         """
         self.config = config
         self._runs: Optional[List["CopickRun"]] = None
+        self._runs_future: Optional[concurrent.futures.Future] = None
         self._objects: Optional[List[CopickObject]] = None
 
         # If runs are specified in the config, create them
@@ -374,10 +439,30 @@ class CopickRoot:
     @property
     def runs(self) -> List["CopickRun"]:
         if self._runs is None:
-            self._runs = self.query()
+            # The future is dropped first, so that a failed prefetch is not raised again on the next access
+            future, self._runs_future = self._runs_future, None
+            self._runs = future.result() if future is not None else self.query()
 
         return self._runs
 
+    def prefetch_runs(self) -> concurrent.futures.Future:
+        """Start querying the runs in a background thread, so that the storage round-trips overlap with other work.
+        The next access to `runs` or `get_run` waits for the query instead of issuing a new one. If the query failed,
+        that access raises its error once and later accesses query again.
+
+        Returns:
+            concurrent.futures.Future: Future resolving to the list of runs.
+        """
+        failed = self._runs_future is not None and self._runs_future.done() and self._runs_future.exception()
+        if self._runs_future is None or failed:
+            if self._runs is not None:
+                self._runs_future = concurrent.futures.Future()
+                self._runs_future.set_result(self._runs)
+            else:
+                self._runs_future = _prefetch_executor.submit(self.query)
+
+        return self._runs_future
+
     def get_run(self, name: str, **kwargs) -> Union["CopickRun", None]:
         """Get run by name.
 
@@ -388,8 +473,8 @@ class CopickRoot:
         Returns:
             CopickRun: The run with the given name, or None if not found.
         """
-        # Random access
-        if self._runs is None:
+        # Random access, unless the runs are already being queried
+        if self._runs is None and self._runs_future is None:
             clz, meta_clz = self._run_factory()
             rm = meta_clz(name=name, **kwargs)
             run = clz(self, meta=rm)
@@ -433,6 +518,7 @@ class CopickRoot:
     def refresh(self) -> None:
         """Refresh the list of runs."""
         self._runs = self.query()
+        self._runs_future = None
 
     def new_run(self, name: str, **kwargs) -> "CopickRun":
         """Create a new run.
@@ -1250,6 +1336,9 @@ class CopickTomogram:
         self._features: Optional[List["CopickFeatures"]] = None
         """Features for this tomogram."""
 
+        self._group: Optional["zarr.Group"] = None
+        """Cached Zarr-group of this tomogram."""
+
         if config is not None and self.tomo_type in config.features[self.voxel_spacing.voxel_size]:
             feat_metas = [CopickFeaturesMeta(tomo_type=self.tomo_type, feature_type=ft) for ft in config.feature_types]
             self._features = [CopickFeatures(tomogram=self, meta=fm) for fm in feat_metas]
@@ -1333,20 +1422,74 @@ class CopickTomogram:
         self._features = self.query_features()
 
     def refresh(self) -> None:
-        """Refresh `CopickTomogram.features` from storage."""
+        """Refresh `CopickTomogram.features` from storage. Also drops the cached zarr group, so the metadata is read
+        from storage again."""
+        self._group = None
         self.refresh_features()
 
-    def zarr(self) -> MutableMapping:
+    def zarr(self, cache_size: Optional[int] = None) -> MutableMapping:
         """Override to return the Zarr store for this tomogram. Also needs to handle creating the store if it
-        doesn't exist."""
+        doesn't exist.
+
+        Args:
+            cache_size: Size of the chunk cache in bytes if the store is read-only and remote. Default is the cache
+                shared by all remote stores, 0 disables caching.
+        """
         raise NotImplementedError("zarr must be implemented for CopickTomogram.")
 
+    def _open_group(self) -> "zarr.Group":
+        """Open the Zarr-group of this tomogram for reading. The group and its metadata are cached, so repeated accesses don't
+        parse the metadata again. Writing the tomogram with `from_numpy` or calling `refresh` drops the cached group."""
+        if self._group is None:
+            self._group = open_group(self.zarr())
+
+        return self._group
+
+    def data(self, zarr_group: str = "0", dtype: Optional[np.dtype] = None) -> "zarr.Array":
+        """Returns the Zarr-Array for this tomogram without reading it. Chunks are only read and decoded when the
+        array is indexed, e.g. `tomogram.data()[100:228, 100:228, 100:228]` only reads the chunks overlapping the
+        subvolume.
+
+        Args:
+            zarr_group: Zarr group to access.
+            dtype: Data type the chunks are cast to while reading. Default is the stored data type.
+
+        Returns:
+            zarr.Array: The tomogram as a lazy zarr array.
+        """
+        array = self._open_group()[zarr_group]
+        return array if dtype is None else array.astype(dtype)
+
+    def tensorstore(self, zarr_group: str = "0") -> "TensorStore":
+        """Returns a read-only TensorStore for this tomogram. Requires the optional `tensorstore` dependency.
+
+        Args:
+            zarr_group: Zarr group to access.
+
+        Returns:
+            TensorStore: The tomogram as a lazy TensorStore array.
+        """
+        return open_tensorstore(self.zarr(), zarr_group)
+
+    def cupy(self, zarr_group: str = "0") -> "ndarray":
+        """Returns the content of the Zarr-File for this tomogram as a cupy array, decompressed on the GPU. Requires the
+        optional `kvikio` and `cupy` dependencies, a local store and an nvCOMP-compatible compressor.
+
+        Args:
+            zarr_group: Zarr group to access.
+
+        Returns:
+            cupy.ndarray: The tomogram in GPU memory.
+        """
+        return read_cupy(self.zarr(), zarr_group)
+
     def numpy(
         self,
         zarr_group: str = "0",
         x: slice = slice(None, None),
         y: slice = slice(None, None),
         z: slice = slice(None, None),
+        dtype: Optional[np.dtype] = None,
     ) -> np.ndarray:
         """Returns the content of the Zarr-File for this tomogram as a numpy array. Multiscale group and slices are
         supported.
@@ -1356,25 +1499,47 @@ class CopickTomogram:
             x: Slice for the x-axis.
             y: Slice for the y-axis.
             z: Slice for the z-axis.
+            dtype: Data type of the returned array. Chunks are cast as they are decoded, so no full-size
+                intermediate of the stored type is created. Default is the stored data type.
 
         Returns:
             np.ndarray: The tomogram as a numpy array.
         """
 
-        loc = self.zarr()
-        group = zarr.open(loc)[zarr_group]
+        group = self._open_group()[zarr_group]
+        if dtype is not None:
+            group = group.astype(dtype)
 
         fits, req, avail = fits_in_memory(group, (x, y, z))
         if not fits:
             raise ValueError(f"Requested region does not fit in memory. Requested: {req}, Available: {avail}.")
 
-        return np.array(zarr.open(loc)[zarr_group][z, y, x])
+        return read_chunks(group, (z, y, x))
+
+    def extract_subvolumes(self, points: np.ndarray, size: int, zarr_group: str = "0") -> np.ndarray:
+        """Extract cubic subvolumes centered on a set of points, reading each overlapping chunk only once.
+
+        Args:
+            points: (N, 3) array of points in angstrom, in (x, y, z) order as returned by `CopickPicks.numpy()`.
+            size: Edge length of the subvolumes in voxels.
+            zarr_group: Zarr group to access.
+
+        Returns:
+            np.ndarray: (N, size, size, size) array of subvolumes in (z, y, x) order.
+        """
+        group = self._open_group()
+        datasets = group.attrs["multiscales"][0]["datasets"]
+        dataset = next(d for d in datasets if d["path"] == zarr_group)
+        voxel_size = dataset["coordinateTransformations"][0]["scale"][0]
+
+        return extract_subvolumes(group[zarr_group], np.asarray(points) / voxel_size, size)
 
     def from_numpy(
         self,
         data: np.ndarray,
         levels: int = 3,
         dtype: Optional[np.dtype] = np.float32,
+        compressor: Optional["Codec"] = DEFAULT_COMPRESSOR,
     ) -> None:
         """Set the tomogram from a numpy array and compute multiscale pyramid. By default, three levels of the pyramid
         are computed.
@@ -1383,10 +1548,12 @@ class CopickTomogram:
             data: The segmentation as a numpy array.
             levels: Number of levels in the multiscale pyramid.
             dtype: Data type of the segmentation. Default is `np.float32`.
+            compressor: Compressor for the chunks, None disables compression. Default is Blosc LZ4 with byte shuffling.
         """
         loc = self.zarr()
         pyramid = volume_pyramid(data, self.voxel_spacing.voxel_size, levels, dtype=dtype)
-        write_ome_zarr_3d(loc, pyramid)
+        write_ome_zarr_3d(loc, pyramid, compressor=compressor)
+        self._group = None
 
     def set_region(
         self,
@@ -1441,6 +1608,9 @@ class CopickFeatures:
         self.meta: CopickFeaturesMeta = meta
         self.tomogram: CopickTomogram = tomogram
 
+        self._group: Optional["zarr.Group"] = None
+        """Cached Zarr-group of this feature map."""
+
     def __repr__(self):
         return f"CopickFeatures(tomo_type={self.tomo_type}, feature_type={self.feature_type}) at {hex(id(self))}"
 
@@ -1457,10 +1627,43 @@ class CopickFeatures:
         doesn't exist."""
         raise NotImplementedError("zarr must be implemented for CopickFeatures.")
 
+    def _open_group(self) -> "zarr.Group":
+        """Open the Zarr-group of this feature map for reading. The group and its metadata are cached, so repeated
+        accesses don't parse the metadata again."""
+        if self._group is None:
+            self._group = open_group(self.zarr())
+
+        return self._group
+
+    def data(self, zarr_group: str = "0", dtype: Optional[np.dtype] = None) -> "zarr.Array":
+        """Returns the Zarr-Array for this feature map without reading it. Chunks are only read when the array is indexed.
+
+        Args:
+            zarr_group: Zarr group to access.
+            dtype: Data type the chunks are cast to while reading. Default is the stored data type.
+
+        Returns:
+            zarr.Array: The feature map as a lazy zarr array.
+        """
+        array = self._open_group()[zarr_group]
+        return array if dtype is None else array.astype(dtype)
+
+    def tensorstore(self, zarr_group: str = "0") -> "TensorStore":
+        """Returns a read-only TensorStore for this feature map. Requires the optional `tensorstore` dependency.
+
+        Args:
+            zarr_group: Zarr group to access.
+
+        Returns:
+            TensorStore: The feature map as a lazy TensorStore array.
+        """
+        return open_tensorstore(self.zarr(), zarr_group)
+
     def numpy(
         self,
         zarr_group: str = "0",
         slices: Tuple[slice, ...] = None,
+        dtype: Optional[np.dtype] = None,
     ) -> np.ndarray:
         """Returns the content of the Zarr-File for this feature map as a numpy array. Multiscale group and slices are
         supported.
@@ -1468,13 +1671,16 @@ class CopickFeatures:
         Args:
             zarr_group: Zarr group to access.
             slices: Tuple of slices for the axes.
+            dtype: Data type of the returned array. Chunks are cast as they are decoded, so no full-size
+                intermediate of the stored type is created. Default is the stored data type.
 
         Returns:
             np.ndarray: The object as a numpy array.
         """
 
-        loc = self.zarr()
-        group = zarr.open(loc)[zarr_group]
+        group = self._open_group()[zarr_group]
+        if dtype is not None:
+            group = group.astype(dtype)
         ndim = len(group.shape)
 
         if slices is None:
@@ -1484,7 +1690,7 @@ class CopickFeatures:
         if not fits:
             raise ValueError(f"Requested region does not fit in memory. Requested: {req}, Available: {avail}.")
 
-        return np.array(group[slices])
+        return read_chunks(group, slices)
 
     def set_region(
         self,
@@ -1529,6 +1735,25 @@ class CopickPicksFile(BaseModel):
     points: Optional[List[CopickPoint]] = None
     trust_orientation: Optional[bool] = True
 
+    # Write NaN and infinite values as the JSON constants the picks files were always written with, not as null.
+    model_config = {
+        "ser_json_inf_nan": "constants",
+    }
+
+
+def _points_json_to_numpy(points: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    n = len(points)
+    identity = CopickPoint.model_fields["transformation_"].default
+
+    locations = np.fromiter(
+        (p["location"][c] for p in points for c in ("x", "y", "z")),
+        dtype=float,
+        count=3 * n,
+    ).reshape(n, 3)
+    transforms = np.array([p.get("transformation_") or identity for p in points], dtype=float).reshape(n, 4, 4)
+
+    return locations, transforms
+
 
 class CopickPicks:
     """Encapsulates all data pertaining to a specific set of picked points. This includes the locations, orientations,
@@ -1556,6 +1781,9 @@ class CopickPicks:
         self.meta: CopickPicksFile = file
         self.run: CopickRun = run
 
+        # Arrays parsed from the JSON file by numpy() while the points are not loaded
+        self._arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
     def __repr__(self):
         lpt = None if self.meta.points is None else len(self.meta.points)
         ret = (
@@ -1573,6 +1801,20 @@ class CopickPicks:
         the file if it doesn't exist."""
         raise NotImplementedError("store must be implemented for CopickPicks.")
 
+    def _load_json(self) -> Optional[bytes]:
+        """Override this method to return the raw JSON content of the picks file, if the points are stored as JSON.
+        Used by `CopickPicks.numpy()` to read points without validating every point."""
+        return None
+
+    def _store_json(self, data: str) -> bool:
+        """Override this method to store the raw JSON content of the picks file, if the points are stored as JSON.
+        Used by `CopickPicks.from_numpy()` to store points without constructing every point.
+
+        Returns:
+            bool: Whether the content was stored.
+        """
+        return False
+
     def load(self) -> CopickPicksFile:
         """Load the points from storage.
 
@@ -1580,6 +1822,7 @@ class CopickPicks:
             CopickPicksFile: The loaded points.
         """
         self.meta = self._load()
+        self._arrays = None
 
         return self.meta
 
@@ -1617,6 +1860,7 @@ class CopickPicks:
     @points.setter
     def points(self, value: List[CopickPoint]) -> None:
         self.meta.points = value
+        self._arrays = None
 
     @property
     def trust_orientation(self) -> bool:
@@ -1646,13 +1890,26 @@ class CopickPicks:
         Returns:
             Tuple[np.ndarray, np.ndarray]: The picks and transforms as numpy arrays.
         """
+        # Points not loaded yet, read them straight from the JSON file if possible. The parsed arrays are kept until the
+        # points are loaded, refreshed or replaced, and copies are returned so callers can't modify them.
+        if self.meta.points is None:
+            if self._arrays is None:
+                raw = self._load_json()
+                if raw is not None:
+                    self._arrays = _points_json_to_numpy(json.loads(raw).get("points") or [])
+
+            if self._arrays is not None:
+                points, transforms = self._arrays
+                return points.copy(), transforms.copy()
 
-        points = np.zeros((len(self.points), 3))
-        transforms = np.zeros((len(self.points), 4, 4))
+        n = len(self.points)
 
-        for i, p in enumerate(self.points):
-            points[i, :] = np.array([p.location.x, p.location.y, p.location.z])
-            transforms[i, :, :] = p.transformation
+        points = np.fromiter(
+            (c for p in self.points for c in (p.location.x, p.location.y, p.location.z)),
+            dtype=float,
+            count=3 * n,
+        ).reshape(n, 3)
+        transforms = np.array([p.transformation_ for p in self.points], dtype=float).reshape(n, 4, 4)
 
         return points, transforms
 
@@ -1671,20 +1928,42 @@ class CopickPicks:
                 ```
 
         """
+        positions = np.asarray(positions, dtype=float)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError("Positions must be a [N, 3] array.")
 
-        if positions.shape[0] != transforms.shape[0]:
-            raise ValueError("Number of positions and transforms must be the same.")
-
-        points = []
+        n = positions.shape[0]
+        if transforms is None:
+            transforms = np.broadcast_to(np.eye(4), (n, 4, 4))
+        transforms = np.asarray(transforms, dtype=float)
 
-        for i in range(positions.shape[0]):
-            p = CopickPoint(location=CopickLocation(x=positions[i, 0], y=positions[i, 1], z=positions[i, 2]))
-            if transforms is not None:
-                p.transformation = transforms[i, :, :]
-            points.append(p)
-
-        self.points = points
-        self.store()
+        if transforms.shape[0] != n:
+            raise ValueError("Number of positions and transforms must be the same.")
+        if transforms.shape[1:] != (4, 4):
+            raise ValueError("Transforms must be a [N, 4, 4] array.")
+        # Same rule as CopickPoint.validate_transformation, so every written file can be loaded again.
+        if not np.all(transforms[:, 3, 3] == 1.0):
+            raise ValueError("Last element of all transformation matrices must be 1.0.")
+        if not np.all(np.abs(transforms[:, 3, :3]) <= 1e-8):
+            raise ValueError("Last row of all transformation matrices must be [0, 0, 0, 1].")
+
+        instance_id = CopickPoint.model_fields["instance_id"].default
+        score = CopickPoint.model_fields["score"].default
+        points = [
+            {"location": {"x": x, "y": y, "z": z}, "transformation_": t, "instance_id": instance_id, "score": score}
+            for (x, y, z), t in zip(positions.tolist(), transforms.tolist())
+        ]
+
+        # The arrays are validated as a whole above, so the file is written without constructing every point. The
+        # points are loaded lazily when they are accessed.
+        meta = self.meta.model_copy(update={"points": None}).model_dump(mode="json")
+        data = {key: points if key == "points" else value for key, value in meta.items()}
+        self._arrays = None
+        if self._store_json(json.dumps(data, indent=4)):
+            self.meta.points = None
+        else:
+            self.points = [CopickPoint(**p) for p in points]
+            self.store()
 
 
 class CopickMeshMeta(BaseModel):
@@ -1847,6 +2126,9 @@ class CopickSegmentation:
         self.meta: CopickSegmentationMeta = meta
         self.run: CopickRun = run
 
+        self._group: Optional["zarr.Group"] = None
+        """Cached Zarr-group of this segmentation."""
+
     def __repr__(self):
         ret = (
             f"CopickSegmentation(user_id={self.user_id}, session_id={self.session_id}, name={self.name}, "
@@ -1889,17 +2171,55 @@ class CopickSegmentation:
         else:
             return self.run.root.get_object(self.name).color
 
-    def zarr(self) -> MutableMapping:
+    def zarr(self, cache_size: Optional[int] = None) -> MutableMapping:
         """Override to return the Zarr store for this segmentation. Also needs to handle creating the store if it
-        doesn't exist."""
+        doesn't exist.
+
+        Args:
+            cache_size: Size of the chunk cache in bytes if the store is read-only and remote. Default is the cache
+                shared by all remote stores, 0 disables caching.
+        """
         raise NotImplementedError("zarr must be implemented for CopickSegmentation.")
 
+    def _open_group(self) -> "zarr.Group":
+        """Open the Zarr-group of this segmentation for reading. The group and its metadata are cached, so repeated accesses don't
+        parse the metadata again. Writing the segmentation with `from_numpy` drops the cached group."""
+        if self._group is None:
+            self._group = open_group(self.zarr())
+
+        return self._group
+
+    def data(self, zarr_group: str = "0", dtype: Optional[np.dtype] = None) -> "zarr.Array":
+        """Returns the Zarr-Array for this segmentation without reading it. Chunks are only read when the array is indexed.
+
+        Args:
+            zarr_group: Zarr group to access.
+            dtype: Data type the chunks are cast to while reading. Default is the stored data type.
+
+        Returns:
+            zarr.Array: The segmentation as a lazy zarr array.
+        """
+        array = self._open_group()[zarr_group]
+        return array if dtype is None else array.astype(dtype)
+
+    def tensorstore(self, zarr_group: str = "0") -> "TensorStore":
+        """Returns a read-only TensorStore for this segmentation. Requires the optional `tensorstore` dependency.
+
+        Args:
+            zarr_group: Zarr group to access.
+
+        Returns:
+            TensorStore: The segmentation as a lazy TensorStore array.
+        """
+        return open_tensorstore(self.zarr(), zarr_group)
+
     def numpy(
         self,
         zarr_group: str = "0",
         x: slice = slice(None, None),
         y: slice = slice(None, None),
         z: slice = slice(None, None),
+        dtype: Optional[np.dtype] = None,
     ) -> np.ndarray:
         """Returns the content of the Zarr-File for this segmentation as a numpy array. Multiscale group and slices are
         supported.
@@ -1909,25 +2229,29 @@ class CopickSegmentation:
             x: Slice for the x-axis.
             y: Slice for the y-axis.
             z: Slice for the z-axis.
+            dtype: Data type of the returned array. Chunks are cast as they are decoded, so no full-size
+                intermediate of the stored type is created. Default is the stored data type.
 
         Returns:
             np.ndarray: The segmentation as a numpy array.
         """
 
-        loc = self.zarr()
-        group = zarr.open(loc)[zarr_group]
+        group = self._open_group()[zarr_group]
+        if dtype is not None:
+            group = group.astype(dtype)
 
         fits, req, avail = fits_in_memory(group, (x, y, z))
         if not fits:
             raise ValueError(f"Requested region does not fit in memory. Requested: {req}, Available: {avail}.")
 
-        return np.array(zarr.open(loc)[zarr_group][z, y, x])
+        return read_chunks(group, (z, y, x))
 
     def from_numpy(
         self,
         data: np.ndarray,
         levels: int = 1,
         dtype: Optional[np.dtype] = np.uint8,
+        compressor: Optional["Codec"] = DEFAULT_COMPRESSOR,
     ) -> None:
         """Set the segmentation from a numpy array and compute multiscale pyramid. By default, no pyramid is computed
         for segmentations.
@@ -1936,10 +2260,12 @@ class CopickSegmentation:
             data: The segmentation as a numpy array.
             levels: Number of levels in the multiscale pyramid.
             dtype: Data type of the segmentation. Default is `np.uint8`.
+            compressor: Compressor for the chunks, None disables compression. Default is Blosc LZ4 with byte shuffling.
         """
         loc = self.zarr()
         pyramid = segmentation_pyramid(data, self.voxel_size, levels, dtype=dtype)
-        write_ome_zarr_3d(loc, pyramid)
+        write_ome_zarr_3d(loc, pyramid, compressor=compressor)
+        self._group = None
 
     def set_region(
         self,
@@ -0,0 +1,143 @@
+import functools
+import itertools
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import zarr
+
+from copick.util.concurrency import run_threaded
+
+
+def _chunk_slices(array: zarr.Array, chunk: Tuple[int, ...]) -> Tuple[slice, ...]:
+    return tuple(slice(c * size, min((c + 1) * size, dim)) for c, size, dim in zip(chunk, array.chunks, array.shape))
+
+
+def _scatter_numpy(
+    data: np.ndarray,
+    start: np.ndarray,
+    stop: np.ndarray,
+    lo: np.ndarray,
+    clo: np.ndarray,
+    chi: np.ndarray,
+    indices: np.ndarray,
+    out: np.ndarray,
+) -> None:
+    for i in indices:
+        a = np.maximum(clo[i], start)
+        b = np.minimum(chi[i], stop)
+        src = tuple(slice(s, e) for s, e in zip(a - start, b - start))
+        dst = tuple(slice(s, e) for s, e in zip(a - lo[i], b - lo[i]))
+        out[(i, *dst)] = data[src]
+
+
+def _scatter_loops(data, start, stop, lo, clo, chi, indices, out):
+    # Explicit slicing of the 3 axes, so that numba can compile it.
+    for i in indices:
+        a = np.maximum(clo[i], start)
+        b = np.minimum(chi[i], stop)
+        out[
+            i,
+            a[0] - lo[i, 0] : b[0] - lo[i, 0],
+            a[1] - lo[i, 1] : b[1] - lo[i, 1],
+            a[2] - lo[i, 2] : b[2] - lo[i, 2],
+        ] = data[
+            a[0] - start[0] : b[0] - start[0],
+            a[1] - start[1] : b[1] - start[1],
+            a[2] - start[2] : b[2] - start[2],
+        ]
+
+
+# Native byte order array types numba can compile, float16 and big-endian data are copied with numpy.
+_NUMBA_DTYPES = tuple(
+    np.dtype(t)
+    for t in (
+        np.bool_,
+        np.int8,
+        np.int16,
+        np.int32,
+        np.int64,
+        np.uint8,
+        np.uint16,
+        np.uint32,
+        np.uint64,
+        np.float32,
+        np.float64,
+        np.complex64,
+        np.complex128,
+    )
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _scatter_kernel(dtype: np.dtype) -> Callable[..., None]:
+    """Return the function copying chunks of the given dtype into subvolumes. Compiled with numba if it is installed
+    and supports the dtype, numba is only imported on the first extraction, so importing copick does not pay its
+    startup cost."""
+    if dtype not in _NUMBA_DTYPES:
+        return _scatter_numpy
+
+    try:
+        import numba
+    except ImportError:
+        return _scatter_numpy
+
+    # Releases the GIL, so the chunks handled by the thread pool are copied in parallel. numba's own parallel
+    # threading layers can't safely be entered from several threads at once, so prange is not used here.
+    return numba.njit(nogil=True)(_scatter_loops)
+
+
+def extract_subvolumes(
+    array: zarr.Array,
+    coords: np.ndarray,
+    size: int,
+    fill_value: float = 0,
+    max_workers: Optional[int] = None,
+) -> np.ndarray:
+    """Extract cubic subvolumes centered on a set of points from a 3D Zarr array.
+
+    Every chunk overlapping at least one subvolume is read and decoded exactly once, and copied into all subvolumes it
+    overlaps. Chunks are processed concurrently, so only a few decoded chunks are held in memory at any time.
+
+    Args:
+        array: The 3D Zarr array (z, y, x) to extract from.
+        coords: (N, 3) array of subvolume centers in voxel coordinates, in (x, y, z) order as returned by
+            `CopickPicks.numpy()` divided by the voxel size.
+        size: Edge length of the subvolumes in voxels.
+        fill_value: Value for the parts of subvolumes outside the array.
+        max_workers: Maximum number of threads used for decoding. Default is the `ThreadPoolExecutor` default.
+
+    Returns:
+        (N, size, size, size) array of subvolumes in (z, y, x) order.
+    """
+    coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+    shape = np.array(array.shape)
+    chunks = np.array(array.chunks)
+
+    # Subvolume bounds (z, y, x), clipped to the array
+    lo = np.round(coords[:, ::-1]).astype(int) - size // 2
+    hi = lo + size
+    clo = np.clip(lo, 0, shape)
+    chi = np.clip(hi, 0, shape)
+
+    out = np.full((coords.shape[0], size, size, size), fill_value, dtype=array.dtype)
+
+    # Map each chunk to the subvolumes overlapping it
+    first = clo // chunks
+    last = (chi - 1) // chunks
+    overlaps: Dict[Tuple[int, ...], List[int]] = {}
+    for i in np.flatnonzero(np.all(chi > clo, axis=1)):
+        for chunk in itertools.product(*(range(f, la + 1) for f, la in zip(first[i], last[i]))):
+            overlaps.setdefault(chunk, []).append(i)
+
+    scatter = _scatter_kernel(out.dtype)
+
+    def _read_and_scatter(chunk: Tuple[int, ...]) -> None:
+        src_slices = _chunk_slices(array, chunk)
+        start = np.array([sl.start for sl in src_slices])
+        stop = np.array([sl.stop for sl in src_slices])
+        scatter(array[src_slices], start, stop, lo, clo, chi, np.array(overlaps[chunk]), out)
+
+    # Each subvolume region is written by exactly one chunk, so the workers never write the same elements.
+    run_threaded(_read_and_scatter, overlaps, max_workers)
+
+    return out
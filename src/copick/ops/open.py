@@ -1,11 +1,18 @@
+import functools
 import json
+import os
 import warnings
-from typing import Any, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 
 from copick import __version__
-from copick.impl.cryoet_data_portal import CopickConfigCDP, CopickRootCDP
 from copick.impl.filesystem import CopickConfigFSSpec, CopickRootFSSpec
-from copick.util.portal import objects_from_datasets
+from copick.models import CopickRoot, PickableObject
+from copick.util.storage import chunk_cache
+
+# The data portal backend pulls in the portal client and its GraphQL stack, so it is only imported for projects
+# that use it.
+if TYPE_CHECKING:
+    from copick.impl.cryoet_data_portal import CopickRootCDP
 
 
 def from_string(data: str):
@@ -22,14 +29,50 @@ def from_string(data: str):
     if data["config_type"] == "filesystem":
         return CopickRootFSSpec(CopickConfigFSSpec(**data))
     elif data["config_type"] == "cryoet_data_portal":
+        from copick.impl.cryoet_data_portal import CopickConfigCDP, CopickRootCDP
+
         return CopickRootCDP(CopickConfigCDP(**data))
 
 
-def from_file(path: str):
-    with open(path, "r") as f:
-        data = f.read()
+@functools.lru_cache(maxsize=32)
+def _from_file_cached(path: str, mtime: float) -> CopickRoot:
+    # The modification time is part of the cache key, so edits to the config file invalidate the cached root.
+    return from_file(path, cache=False)
+
+
+def from_file(path: str, cache: bool = True, prefetch: bool = False):
+    """Initialize a Copick project from a configuration file on disk.
+
+    Args:
+        path: Path to the configuration file on disk.
+        cache: Whether to reuse the root returned by a previous call for the same (unmodified) file. Use
+            `clear_config_cache` to drop all cached roots.
+        prefetch: Whether to start querying the runs of the project in the background (see
+            `CopickRoot.prefetch_runs`).
+
+    Returns:
+        CopickRoot: The initialized Copick project.
+    """
+    if cache:
+        path = os.path.abspath(path)
+        root = _from_file_cached(path, os.path.getmtime(path))
+    else:
+        with open(path, "r") as f:
+            data = f.read()
+
+        root = from_string(data)
+
+    if prefetch:
+        root.prefetch_runs()
+
+    return root
 
-    return from_string(data)
+
+@functools.lru_cache(maxsize=32)
+def _objects_from_datasets_cached(dataset_ids: Tuple[int, ...]) -> List[PickableObject]:
+    from copick.util.portal import objects_from_datasets
+
+    return objects_from_datasets(list(dataset_ids))
 
 
 def from_czcdp_datasets(
@@ -39,7 +82,7 @@ def from_czcdp_datasets(
     user_id: Union[str, None] = None,
     session_id: Union[str, None] = None,
     output_path: Union[str, None] = None,
-) -> CopickRootCDP:
+) -> "CopickRootCDP":
     """Create a Copick project from datasets in the CZ cryoET Data Portal.
 
     Args:
@@ -53,8 +96,10 @@ def from_czcdp_datasets(
     Returns:
         CopickRootCDP: The initialized Copick project.
     """
+    from copick.impl.cryoet_data_portal import CopickConfigCDP, CopickRootCDP
 
-    objects = objects_from_datasets(dataset_ids)
+    # Portal queries are cached per set of datasets, copies keep the cached objects independent of the project.
+    objects = [o.model_copy() for o in _objects_from_datasets_cached(tuple(dataset_ids))]
     config = CopickConfigCDP(
         name="CZ cryoET Data Portal Dataset",
         description=f"This copick project contains data from datasets {dataset_ids}.",
@@ -73,3 +118,11 @@ def from_czcdp_datasets(
             f.write(json.dumps(config.model_dump(exclude_unset=True), indent=4))
 
     return CopickRootCDP(config)
+
+
+def clear_config_cache() -> None:
+    """Clear the cached roots returned by `from_file`, the cached portal queries of `from_czcdp_datasets` and the chunks
+    cached for remote stores."""
+    _from_file_cached.cache_clear()
+    _objects_from_datasets_cached.cache_clear()
+    chunk_cache.clear()
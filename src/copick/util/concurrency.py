@@ -0,0 +1,20 @@
+import concurrent.futures
+from typing import Callable, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def run_threaded(func: Callable[[T], None], items: Iterable[T], max_workers: Optional[int] = None) -> None:
+    """Call a function on every item in a thread pool and wait for all calls to finish.
+
+    Args:
+        func: The function to call. Its return values are discarded.
+        items: The items to call the function on.
+        max_workers: Maximum number of threads. Default is the `ThreadPoolExecutor` default.
+
+    Raises:
+        Exception: The first exception raised by one of the calls.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consume the iterator to propagate exceptions
+        list(executor.map(func, items))
@@ -0,0 +1,38 @@
+import os
+from typing import TYPE_CHECKING, MutableMapping
+
+import zarr
+
+from copick.util.storage import is_local
+
+if TYPE_CHECKING:
+    from cupy import ndarray
+
+
+def read_cupy(store: MutableMapping, zarr_group: str = "0") -> "ndarray":
+    """Read one array of a local multiscale zarr store directly into GPU memory with kvikio.
+
+    Chunks are read with GPUDirect Storage (or kvikio's POSIX fallback) and decompressed on the GPU with nvCOMP,
+    bypassing CPU decompression entirely. This requires the array to be written with an nvCOMP-compatible compressor
+    (e.g. LZ4); Blosc-compressed arrays can not be decoded on the GPU.
+
+    Args:
+        store: The local zarr store containing the multiscale group.
+        zarr_group: Zarr group to access.
+
+    Returns:
+        cupy.ndarray: The array in GPU memory.
+    """
+    # Imported on use, kvikio loads cupy and the CUDA libraries.
+    try:
+        import kvikio.zarr
+    except ImportError as e:
+        raise ImportError("kvikio and cupy are required to read arrays into GPU memory: pip install copick[gpu]") from e
+
+    local = isinstance(store, zarr.storage.DirectoryStore)
+    local = local or (isinstance(store, zarr.storage.FSStore) and is_local(store.fs))
+    if not local:
+        raise ValueError("GPU reads are only supported for stores on the local filesystem.")
+
+    array = kvikio.zarr.open_cupy_array(os.path.join(store.path, zarr_group), mode="r")
+    return array[:]
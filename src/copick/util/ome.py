@@ -1,10 +1,26 @@
-from typing import Any, Dict, List, MutableMapping, Tuple
+import itertools
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple
 
 import numpy as np
 import psutil
 import zarr
-from ome_zarr.writer import write_multiscale
-from skimage.transform import downscale_local_mean, rescale
+from numcodecs import Blosc
+from numcodecs.abc import Codec
+from ome_zarr.writer import write_multiscales_metadata
+from skimage.transform import downscale_local_mean
+
+from copick.util.concurrency import run_threaded
+from copick.util.storage import is_local, is_local_store, metadata_store
+
+# Chunk size targets for written arrays, following the usual 1-10 MB (local) and 5-50 MB (object store) guidance
+LOCAL_CHUNK_BYTES = 4 * 1024**2
+REMOTE_CHUNK_BYTES = 16 * 1024**2
+
+# Compressor for written arrays (zarr's default, made explicit so callers can choose another codec)
+DEFAULT_COMPRESSOR = Blosc(cname="lz4", clevel=5, shuffle=Blosc.SHUFFLE)
+
+# Minimum number of z-slices of the full resolution volume downsampled per task
+DOWNSCALE_SLAB = 16
 
 
 def _ome_zarr_axes() -> List[Dict[str, str]]:
@@ -36,27 +52,54 @@ def volume_pyramid(
     voxel_size: float,
     levels: int,
     dtype: np.dtype = np.float32,
+    max_workers: Optional[int] = None,
 ) -> Dict[float, np.ndarray]:
     """Create a volume pyramid by downscaling with interpolation, maintaining the local mean.
 
+    All levels are computed in a single pass over slabs of the volume: each slab is cast and then downscaled level by
+    level while it is still in cache, and slabs are processed concurrently. The result is identical to repeatedly
+    applying `skimage.transform.downscale_local_mean(level, (2, 2, 2))` to the whole volume.
+
     Args:
         volume: The volume to downsample.
         voxel_size: The voxel size of the input volume.
         levels: The number of levels in the pyramid.
         dtype: The data type of the output arrays.
+        max_workers: Maximum number of threads. Default is the `ThreadPoolExecutor` default.
 
     Returns:
         A dictionary containing the pyramid with the voxel size as the key.
     """
-    pyramid = {voxel_size: volume.astype(dtype)}
-    vs = voxel_size
-
+    shapes = [volume.shape]
     for _ in range(1, levels):
-        array = pyramid[vs]
-        vs *= 2
-        pyramid[vs] = downscale_local_mean(array, (2, 2, 2)).astype(dtype)
+        shapes.append(tuple(-(-dim // 2) for dim in shapes[-1]))
+    arrays = [np.empty(shape, dtype=dtype) for shape in shapes]
 
-    return pyramid
+    # Slabs start at multiples of 2 ** (levels - 1), so they stay aligned with the 2x2x2 blocks of every level.
+    thickness = max(DOWNSCALE_SLAB, 2 ** (levels - 1))
+
+    def _downscale_slab(start: int) -> None:
+        stop = min(start + thickness, volume.shape[0])
+        arrays[0][start:stop] = volume[start:stop]
+
+        for level in range(1, levels):
+            slab = arrays[level - 1][start:stop]
+            start, stop = start // 2, -(-stop // 2)
+            arrays[level][start:stop] = downscale_local_mean(slab, (2,) * volume.ndim)
+
+    run_threaded(_downscale_slab, range(0, volume.shape[0], thickness), max_workers)
+
+    return {voxel_size * 2**level: array for level, array in enumerate(arrays)}
+
+
+def _nearest_indices(n: int) -> np.ndarray:
+    """Indices of the samples kept along an axis of length `n` when downsampling by 2 without interpolation.
+
+    Matches the nearest-neighbour sampling of `skimage.transform.rescale(..., 0.5, order=0)`: the output has
+    `round(n / 2)` samples, and output sample `i` is taken at input position `(i + 0.5) * n / m - 0.5`, rounded up.
+    """
+    m = max(int(np.round(n / 2)), 1)
+    return np.minimum((2 * np.arange(m) + 1) * n // (2 * m), n - 1)
 
 
 def segmentation_pyramid(
@@ -67,6 +110,9 @@ def segmentation_pyramid(
 ) -> Dict[float, np.ndarray]:
     """Create an image pyramid by downsampling without interpolation.
 
+    Each level is gathered directly from the previous one with integer index arrays, which gives the same result as
+    `skimage.transform.rescale(level, 0.5, order=0)` without its float64 intermediate copy of every level.
+
     Args:
         segmentation: The segmentation to downsample.
         voxel_size: The voxel size of the input segmentation.
@@ -82,15 +128,7 @@ def segmentation_pyramid(
     for _ in range(1, levels):
         array = pyramid[vs]
         vs *= 2
-        pyramid[vs] = (
-            rescale(
-                array,
-                (1.0 / 2.0, 1.0 / 2.0, 1.0 / 2.0),
-                anti_aliasing=False,
-                preserve_range=True,
-                order=0,
-            ).astype(dtype),
-        )
+        pyramid[vs] = array[np.ix_(*(_nearest_indices(dim) for dim in array.shape))]
 
     return pyramid
 
@@ -102,30 +140,102 @@ def ome_metadata(pyramid: Dict[float, np.ndarray]) -> Dict[str, Any]:
     }
 
 
+def auto_chunk_size(shape: Tuple[int, ...], dtype: np.dtype, target_bytes: int) -> Tuple[int, ...]:
+    """Compute an isotropic chunk size for an array, such that chunks hold at most `target_bytes`.
+
+    Args:
+        shape: The shape of the array.
+        dtype: The data type of the array.
+        target_bytes: The maximum size of a chunk in bytes.
+
+    Returns:
+        The chunk size, the largest cube within the size target clipped to the array shape.
+    """
+    elements = max(1, target_bytes // np.dtype(dtype).itemsize)
+
+    # Integer root, corrected for floating point error in the exact cube case
+    edge = max(1, round(elements ** (1 / len(shape))))
+    while edge ** len(shape) > elements:
+        edge -= 1
+
+    return tuple(min(edge, dim) for dim in shape)
+
+
+def _target_chunk_bytes(store: MutableMapping) -> int:
+    fs = getattr(store, "fs", None)
+    if fs is None or is_local(fs):
+        return LOCAL_CHUNK_BYTES
+    return REMOTE_CHUNK_BYTES
+
+
+def _chunk_blocks(array: zarr.Array) -> Iterator[Tuple[slice, ...]]:
+    starts = itertools.product(*(range(0, dim, chunk) for dim, chunk in zip(array.shape, array.chunks)))
+    for start in starts:
+        yield tuple(slice(lo, lo + chunk) for lo, chunk in zip(start, array.chunks))
+
+
 def write_ome_zarr_3d(
     store: MutableMapping,
     pyramid: Dict[float, np.ndarray],
-    chunk_size: Tuple[int, ...] = (256, 256, 256),
+    chunk_size: Optional[Tuple[int, ...]] = None,
+    compressor: Optional[Codec] = DEFAULT_COMPRESSOR,
+    max_workers: Optional[int] = None,
 ) -> None:
-    """Write a 3D pyramid to an OME-Zarr store.
+    """Write a 3D pyramid to an OME-Zarr store. The chunks of all levels are compressed and written by one thread
+    pool, so small levels do not leave the pool idle and remote stores see a steady stream of concurrent requests. The
+    metadata of the group and all arrays is consolidated into a single `.zmetadata` key, so readers can open the
+    pyramid with one request.
 
     Args:
         store: The store to write to.
         pyramid: The pyramid to write.
-        chunk_size: The chunk size to use for the Zarr store. Default is (256, 256, 256).
+        chunk_size: The chunk size to use for the Zarr store. Default is an isotropic chunk size of at most
+            `LOCAL_CHUNK_BYTES` for local and in-memory stores and `REMOTE_CHUNK_BYTES` for remote stores. Chunks
+            are clipped to the shape of each level, so small levels are not padded to full chunks.
+        compressor: The compressor for the chunks, None disables compression. Default is Blosc LZ4 with byte
+            shuffling.
+        max_workers: Maximum number of threads used for encoding and writing. Default is the `ThreadPoolExecutor`
+            default.
+
+    Raises:
+        ValueError: If the chunk size is not one positive integer per axis.
     """
+    if chunk_size is not None:
+        ndim = next(iter(pyramid.values())).ndim
+        if len(chunk_size) != ndim or not all(isinstance(c, (int, np.integer)) and c > 0 for c in chunk_size):
+            raise ValueError(f"Chunk size must be {ndim} positive integers, got {chunk_size}.")
+
     ome_meta = ome_metadata(pyramid)
     root_group = zarr.group(store=store, overwrite=True)
 
-    write_multiscale(
-        list(pyramid.values()),
-        group=root_group,
-        axes=ome_meta["axes"],
-        coordinate_transformations=ome_meta["transforms"],
-        storage_options=dict(chunks=chunk_size, overwrite=True),
-        compute=True,
-        metadata={},
-    )
+    datasets = []
+    writes = []
+    for level, (array, transforms) in enumerate(zip(pyramid.values(), ome_meta["transforms"])):
+        if chunk_size is None:
+            chunks = auto_chunk_size(array.shape, array.dtype, _target_chunk_bytes(store))
+        else:
+            chunks = tuple(min(c, dim) for c, dim in zip(chunk_size, array.shape))
+
+        zarray = root_group.create_dataset(
+            str(level),
+            shape=array.shape,
+            chunks=chunks,
+            dtype=array.dtype,
+            compressor=compressor,
+            overwrite=True,
+        )
+        writes.extend((zarray, array, block) for block in _chunk_blocks(zarray))
+        datasets.append({"path": str(level), "coordinateTransformations": transforms})
+
+    def _write_block(write: Tuple[zarr.Array, np.ndarray, Tuple[slice, ...]]) -> None:
+        zarray, array, block = write
+        zarray[block] = array[block]
+
+    # Every chunk is written by exactly one thread, so the writes never touch the same chunk.
+    run_threaded(_write_block, writes, max_workers)
+
+    write_multiscales_metadata(root_group, datasets, axes=ome_meta["axes"], metadata={})
+    zarr.consolidate_metadata(metadata_store(store))
 
 
 def fits_in_memory(array: zarr.Group, slices: Tuple[slice, ...]) -> Tuple[bool, int, int]:
@@ -151,3 +261,55 @@ def fits_in_memory(array: zarr.Group, slices: Tuple[slice, ...]) -> Tuple[bool,
     fits = requested < available
 
     return fits, requested, available
+
+
+def read_chunks(
+    array: zarr.Array,
+    slices: Tuple[slice, ...],
+    max_workers: Optional[int] = None,
+) -> np.ndarray:
+    """Read a region of a Zarr array, decoding all chunks overlapping the region concurrently.
+
+    Chunk decompression releases the GIL, so decoding the chunks of large regions in a thread pool scales with the
+    number of cores. Blosc only uses its internal threads when called from the main thread, so the workers do not
+    oversubscribe the CPU. Regions of remote arrays are read by zarr directly, which fetches all chunks with one
+    batched, concurrent request instead of one request per chunk.
+
+    Args:
+        array: The Zarr array to read from.
+        slices: The slices to apply to the array. Missing trailing slices select the full axis.
+        max_workers: Maximum number of threads used for decoding. Default is the `ThreadPoolExecutor` default.
+
+    Returns:
+        The requested region as a numpy array.
+    """
+    slices = tuple(slices) + tuple(slice(None, None) for _ in range(array.ndim - len(slices)))
+    bounds = [sl.indices(dim) for dim, sl in zip(array.shape, slices)]
+
+    # Strided selections are left to zarr
+    if any(step != 1 for _, _, step in bounds):
+        return array[slices]
+
+    # Chunk-aligned blocks covering the region, per axis
+    axis_blocks = []
+    for (start, stop, _), chunk in zip(bounds, array.chunks):
+        stop = max(start, stop)
+        axis_blocks.append(
+            [(max(start, c * chunk), min(stop, (c + 1) * chunk)) for c in range(start // chunk, -(-stop // chunk))],
+        )
+
+    blocks = list(itertools.product(*axis_blocks))
+    if len(blocks) <= 1 or not is_local_store(array.chunk_store):
+        return array[slices]
+
+    out = np.empty(tuple(max(0, stop - start) for start, stop, _ in bounds), dtype=array.dtype)
+    offset = tuple(start for start, _, _ in bounds)
+
+    def _read_block(block: Tuple[Tuple[int, int], ...]) -> None:
+        src = tuple(slice(lo, hi) for lo, hi in block)
+        dst = tuple(slice(lo - o, hi - o) for (lo, hi), o in zip(block, offset))
+        out[dst] = array[src]
+
+    run_threaded(_read_block, blocks, max_workers)
+
+    return out
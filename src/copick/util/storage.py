@@ -0,0 +1,281 @@
+import mmap
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Mapping, MutableMapping, Optional, Sequence
+
+import zarr
+from fsspec import AbstractFileSystem
+from fsspec.implementations.local import LocalFileSystem
+from zarr.errors import ReadOnlyError
+from zarr.util import buffer_size
+
+# Chunk cache size shared by all remote read-only stores
+REMOTE_CACHE_BYTES = 512 * 1024**2
+
+
+class MemoryMappedDirectoryStore(zarr.storage.DirectoryStore):
+    """Read-only zarr DirectoryStore that memory-maps chunk files instead of reading them into memory.
+
+    Chunk bytes are served straight from the OS page cache, which avoids one userspace copy per chunk and only pages
+    in the parts of a file that are actually decoded.
+    """
+
+    @staticmethod
+    def _fromfile(fn: str) -> Any:
+        with open(fn, "rb") as fh:
+            # Empty files can't be mapped.
+            if fh.seek(0, 2) == 0:
+                return b""
+            return memoryview(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __setitem__(self, key, value):
+        raise ReadOnlyError()
+
+    def __delitem__(self, key):
+        raise ReadOnlyError()
+
+    def rmdir(self, path: str = None):
+        raise ReadOnlyError()
+
+    def rename(self, src_path: str, dst_path: str):
+        raise ReadOnlyError()
+
+    def clear(self):
+        raise ReadOnlyError()
+
+
+class ChunkCache:
+    """Thread-safe least-recently-used cache of chunk bytes with a fixed byte budget.
+
+    Attributes:
+        max_size: The maximum number of bytes held by the cache.
+        hits: The number of chunks served from the cache.
+        misses: The number of chunks that had to be fetched.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._values: OrderedDict = OrderedDict()
+        self._size = 0
+        self._mutex = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """The number of bytes currently held by the cache."""
+        return self._size
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._mutex:
+            value = self._values.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+
+            self._values.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        nbytes = buffer_size(value)
+        if nbytes > self.max_size:
+            return
+
+        with self._mutex:
+            if key in self._values:
+                return
+
+            while self._size + nbytes > self.max_size:
+                _, evicted = self._values.popitem(last=False)
+                self._size -= buffer_size(evicted)
+
+            self._values[key] = value
+            self._size += nbytes
+
+    def clear(self) -> None:
+        """Drop all cached chunks."""
+        with self._mutex:
+            self._values.clear()
+            self._size = 0
+
+
+# Shared by all remote read-only stores, so the memory used for chunks stays bounded however many tomograms are read.
+# Emptied by `copick.clear_config_cache()`.
+chunk_cache = ChunkCache(REMOTE_CACHE_BYTES)
+
+
+class CachedStore(zarr.storage.Store):
+    """Read-only wrapper of a remote zarr store that serves chunks from a `ChunkCache`.
+
+    Metadata keys are always read from the wrapped store. Batched reads of uncached chunks are forwarded to the wrapped
+    store's `getitems`, so an `FSStore` still fetches them concurrently.
+    """
+
+    def __init__(self, store: zarr.storage.BaseStore, cache: ChunkCache, prefix: str):
+        """
+        Args:
+            store: The store to wrap.
+            cache: The cache for the chunks.
+            prefix: Identifies the store within the cache, e.g. its URL.
+        """
+        self._store = store
+        self._cache = cache
+        self._prefix = prefix
+        self._writeable = False
+
+    def __getitem__(self, key: str) -> Any:
+        if _is_metadata_key(key):
+            return self._store[key]
+
+        value = self._cache.get((self._prefix, key))
+        if value is None:
+            value = self._store[key]
+            self._cache.put((self._prefix, key), value)
+
+        return value
+
+    def getitems(self, keys: Sequence[str], *, contexts: Mapping[str, Any]) -> Mapping[str, Any]:
+        values = {}
+        for key in keys:
+            value = None if _is_metadata_key(key) else self._cache.get((self._prefix, key))
+            if value is not None:
+                values[key] = value
+
+        missing = [key for key in keys if key not in values]
+        if missing:
+            fetched = self._store.getitems(missing, contexts=contexts)
+            for key, value in fetched.items():
+                if not _is_metadata_key(key):
+                    self._cache.put((self._prefix, key), value)
+            values.update(fetched)
+
+        return values
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._store
+
+    def __iter__(self):
+        return iter(self._store)
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def listdir(self, path: str = "") -> List[str]:
+        return self._store.listdir(path)
+
+    def __setitem__(self, key, value):
+        raise ReadOnlyError()
+
+    def __delitem__(self, key):
+        raise ReadOnlyError()
+
+
+def _is_metadata_key(key: str) -> bool:
+    return key.rsplit("/", 1)[-1].startswith(".")
+
+
+def unwrap_store(store: MutableMapping) -> MutableMapping:
+    """Return the store wrapped by a chunk cache, or the store itself if it is not wrapped.
+
+    Args:
+        store: The zarr store, optionally wrapped in a CachedStore or LRUStoreCache.
+
+    Returns:
+        The underlying store.
+    """
+    if isinstance(store, (CachedStore, zarr.storage.LRUStoreCache)):
+        return store._store
+
+    return store
+
+
+def is_local(fs: AbstractFileSystem) -> bool:
+    """Check whether a filesystem is the local filesystem."""
+    return isinstance(fs, LocalFileSystem)
+
+
+def is_local_store(store: MutableMapping) -> bool:
+    """Check whether a zarr store reads its chunks from memory or the local filesystem.
+
+    Args:
+        store: The zarr store, optionally wrapped in a chunk cache.
+
+    Returns:
+        bool: False for stores on remote (e.g. S3) filesystems.
+    """
+    store = unwrap_store(store)
+
+    if isinstance(store, zarr.storage.FSStore):
+        return is_local(store.fs)
+
+    return isinstance(store, (zarr.storage.DirectoryStore, zarr.storage.MemoryStore))
+
+
+def metadata_store(store: MutableMapping) -> MutableMapping:
+    """Return the store to use for reading and writing consolidated metadata.
+
+    `FSStore` with a "/" key separator rewrites the ".zmetadata" key to "zmetadata", so its consolidated metadata
+    would not be found by other readers. The underlying fsspec mapper accesses keys verbatim.
+
+    Args:
+        store: The zarr store, optionally wrapped in a chunk cache.
+
+    Returns:
+        The store, or the fsspec mapper of an FSStore.
+    """
+    store = unwrap_store(store)
+
+    if isinstance(store, zarr.storage.FSStore):
+        return store.map
+
+    return store
+
+
+def open_group(store: MutableMapping) -> zarr.Group:
+    """Open a zarr group for reading. If the group has consolidated metadata, the metadata of all arrays is loaded with
+    a single request instead of one request per array. Groups without consolidated metadata are opened as usual.
+
+    Args:
+        store: The zarr store containing the group.
+
+    Returns:
+        zarr.Group: The read-only group.
+    """
+    try:
+        return zarr.open_consolidated(metadata_store(store), mode="r", chunk_store=store)
+    except KeyError:
+        return zarr.open(store, mode="r")
+
+
+def read_only_store(path: str, fs: AbstractFileSystem, cache_size: Optional[int] = None) -> zarr.storage.BaseStore:
+    """Open a zarr store for reading. Local stores are memory-mapped. Remote stores are opened with fsspec and their
+    chunks are cached in memory, so chunks that are read repeatedly (e.g. overlapping subvolumes) are only fetched once.
+
+    Args:
+        path: Path to the zarr store on `fs`.
+        fs: Filesystem containing the store.
+        cache_size: Size of the chunk cache for remote stores in bytes. Default is the process-wide `chunk_cache`
+            shared by all remote stores (`REMOTE_CACHE_BYTES`). A positive size gives the store its own cache, 0
+            disables caching.
+
+    Returns:
+        zarr.storage.BaseStore: The read-only zarr store.
+    """
+    if is_local(fs):
+        return MemoryMappedDirectoryStore(path, dimension_separator="/")
+
+    store = zarr.storage.FSStore(
+        path,
+        fs=fs,
+        mode="r",
+        key_separator="/",
+        dimension_separator="/",
+        create=False,
+    )
+
+    if cache_size == 0:
+        return store
+
+    cache = chunk_cache if cache_size is None else ChunkCache(cache_size)
+    return CachedStore(store, cache, fs.unstrip_protocol(path))
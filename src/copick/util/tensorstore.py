@@ -0,0 +1,113 @@
+from typing import TYPE_CHECKING, Any, Dict, MutableMapping
+
+import zarr
+
+from copick.util.storage import is_local, unwrap_store
+
+if TYPE_CHECKING:
+    import tensorstore as ts
+
+
+def kvstore_spec(store: MutableMapping) -> Dict[str, Any]:
+    """Translate a zarr store into a TensorStore key-value store spec.
+
+    Args:
+        store: A zarr DirectoryStore or FSStore on a local or S3 filesystem, optionally wrapped in a chunk cache.
+
+    Returns:
+        The kvstore spec pointing at the root of the zarr store.
+
+    Raises:
+        ValueError: If the store, or a setting of its filesystem, can not be expressed as a TensorStore spec.
+    """
+    store = unwrap_store(store)
+
+    if isinstance(store, zarr.storage.DirectoryStore):
+        return {"driver": "file", "path": f"{store.path}/"}
+
+    if isinstance(store, zarr.storage.FSStore):
+        fs = store.fs
+        path = store.path.rstrip("/")
+
+        if is_local(fs):
+            return {"driver": "file", "path": f"{path}/"}
+
+        protocols = (fs.protocol,) if isinstance(fs.protocol, str) else fs.protocol
+        if "s3" in protocols:
+            bucket, _, key = path.partition("/")
+            spec = {"driver": "s3", "bucket": bucket, "path": f"{key}/"}
+            spec.update(_s3_options(fs))
+            return spec
+
+    raise ValueError(f"Store {store} is not supported by TensorStore.")
+
+
+def _s3_options(fs) -> Dict[str, Any]:
+    """Translate the settings of an s3fs filesystem into TensorStore s3 kvstore options.
+
+    Raises:
+        ValueError: If the filesystem uses settings that TensorStore can not be given in a spec.
+    """
+    client_kwargs = dict(getattr(fs, "client_kwargs", None) or {})
+    kwargs = dict(getattr(fs, "kwargs", None) or {})
+    options = {}
+
+    # s3fs keeps endpoint_url as an attribute, older configs pass it in client_kwargs
+    endpoint = client_kwargs.pop("endpoint_url", None)
+    endpoint = getattr(fs, "endpoint_url", None) or endpoint
+    if endpoint is not None:
+        options["endpoint"] = endpoint
+
+    region = client_kwargs.pop("region_name", None)
+    if region is not None:
+        options["region"] = region
+
+    if getattr(fs, "requester_pays", False):
+        options["requester_pays"] = True
+
+    if getattr(fs, "anon", False):
+        options["aws_credentials"] = {"type": "anonymous"}
+    elif "profile" in kwargs:
+        options["aws_credentials"] = {"type": "profile", "profile": kwargs.pop("profile")}
+
+    # TensorStore only reads credentials from the environment, profiles or instance metadata.
+    if any(getattr(fs, attr, None) for attr in ("key", "secret", "token")):
+        raise ValueError(
+            "TensorStore can not use the key, secret or token of the filesystem. Provide the credentials "
+            "through the AWS environment variables or a profile instead.",
+        )
+
+    unsupported = {
+        **client_kwargs,
+        **kwargs,
+        **(getattr(fs, "config_kwargs", None) or {}),
+        **(getattr(fs, "s3_additional_kwargs", None) or {}),
+    }
+    if unsupported:
+        raise ValueError(f"Filesystem options {sorted(unsupported)} are not supported by TensorStore.")
+
+    return options
+
+
+def open_tensorstore(store: MutableMapping, zarr_group: str = "0", read_only: bool = True) -> "ts.TensorStore":
+    """Open one array of a multiscale zarr store with TensorStore.
+
+    Args:
+        store: The zarr store containing the multiscale group.
+        zarr_group: Zarr group to access.
+        read_only: Whether to open the array read-only.
+
+    Returns:
+        TensorStore: The opened array. Indexing is lazy, reads are issued with `.read().result()`.
+    """
+    try:
+        import tensorstore as ts
+    except ImportError as e:
+        raise ImportError(
+            "tensorstore is required to open arrays with TensorStore: pip install copick[tensorstore]",
+        ) from e
+
+    kvstore = kvstore_spec(store)
+    kvstore["path"] = f"{kvstore['path']}{zarr_group}/"
+
+    return ts.open({"driver": "zarr", "kvstore": kvstore}, read=True, write=not read_only).result()
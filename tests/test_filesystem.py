@@ -1,11 +1,34 @@
+import os
 from typing import Any, Dict
 
+import copick
+import fsspec
 import numpy as np
 import pytest
+import s3fs
 import zarr
-from copick.impl.filesystem import CopickRootFSSpec
-from copick.models import CopickPicksFile
-from copick.util.ome import write_ome_zarr_3d
+from copick.impl.filesystem import CopickConfigFSSpec, CopickRootFSSpec
+from copick.models import CopickLocation, CopickPicksFile, CopickPoint
+from copick.ops import extract
+from copick.util.ome import (
+    auto_chunk_size,
+    read_chunks,
+    segmentation_pyramid,
+    volume_pyramid,
+    write_ome_zarr_3d,
+)
+from copick.util.storage import (
+    CachedStore,
+    ChunkCache,
+    MemoryMappedDirectoryStore,
+    chunk_cache,
+    is_local,
+    metadata_store,
+    open_group,
+    read_only_store,
+)
+from copick.util.tensorstore import kvstore_spec
+from skimage.transform import downscale_local_mean, rescale
 from trimesh.parent import Geometry
 
 NUMERICAL_PRECISION = 1e-8
@@ -97,6 +120,81 @@ def test_root_refresh(test_payload: Dict[str, Any]):
     assert set(rnames) == {"TS_001", "TS_002", "TS_003"}, "Incorrect runs"
 
 
+def test_root_prefetch_runs(test_payload: Dict[str, Any]):
+    copick_root = test_payload["root"]
+
+    # Prefetching queries the runs in the background
+    future = copick_root.prefetch_runs()
+    assert copick_root.prefetch_runs() is future, "Repeated prefetch should not query again"
+
+    rnames = [r.name for r in future.result()]
+    assert set(rnames) == {"TS_001", "TS_002", "TS_003"}, "Incorrect runs"
+
+    # Access uses the prefetched runs
+    assert copick_root.runs is future.result(), "Prefetched runs should be used"
+    assert copick_root.get_run("TS_001") in copick_root.runs, "Run should be accessed through index"
+
+
+def test_root_prefetch_runs_failure(test_payload: Dict[str, Any], monkeypatch):
+    copick_root = test_payload["root"]
+    monkeypatch.setattr(copick_root, "_runs", None)
+
+    # The first query fails
+    query = copick_root.query
+    calls = []
+
+    def flaky_query():
+        calls.append(1)
+        if len(calls) == 1:
+            raise OSError("Storage unavailable")
+        return query()
+
+    monkeypatch.setattr(copick_root, "query", flaky_query)
+
+    # The failure is raised once
+    future = copick_root.prefetch_runs()
+    with pytest.raises(OSError):
+        _ = copick_root.runs
+
+    # The next access queries again
+    rnames = [r.name for r in copick_root.runs]
+    assert set(rnames) == {"TS_001", "TS_002", "TS_003"}, "Runs should be queried again after a failed prefetch"
+    assert len(calls) == 2, "Runs should be queried twice"
+
+    # A failed prefetch is also replaced by the next prefetch
+    monkeypatch.setattr(copick_root, "_runs", None)
+    calls.clear()
+    future = copick_root.prefetch_runs()
+    with pytest.raises(OSError):
+        future.result()
+    assert copick_root.prefetch_runs() is not future, "Failed prefetch should not be reused"
+    assert copick_root.get_run("TS_001") is not None, "Run should be found after a failed prefetch"
+
+
+def test_root_from_file_cache(test_payload: Dict[str, Any]):
+    cfg_file = str(test_payload["cfg_file"])
+
+    # Repeated opens of an unchanged config return the same root
+    root1 = copick.from_file(cfg_file)
+    root2 = copick.from_file(cfg_file)
+    assert root1 is root2, "Cached root should be reused"
+
+    # Opting out of the cache returns a fresh root
+    root3 = copick.from_file(cfg_file, cache=False)
+    assert root3 is not root1, "Uncached root should not be reused"
+
+    # Modifying the config invalidates the cached root
+    stat = os.stat(cfg_file)
+    os.utime(cfg_file, (stat.st_atime, stat.st_mtime + 10))
+    root4 = copick.from_file(cfg_file)
+    assert root4 is not root1, "Modified config should not reuse the cached root"
+
+    # Clearing the cache drops all cached roots
+    copick.clear_config_cache()
+    root5 = copick.from_file(cfg_file)
+    assert root5 is not root4, "Cleared cache should not reuse the cached root"
+
+
 def test_root_new_run(test_payload: Dict[str, Any]):
     # Setup
     copick_root = test_payload["root"]
@@ -513,6 +611,72 @@ def test_picks_write_numpy(test_payload: Dict[str, Any]):
     with pytest.raises(ValueError):
         picks.from_numpy(POINTS_err, ORIENTATIONS)
 
+    ORIENTATIONS_err = ORIENTATIONS.copy()
+    ORIENTATIONS_err[0, 3, 0] = 1.0
+
+    with pytest.raises(ValueError):
+        picks.from_numpy(POINTS, ORIENTATIONS_err)
+
+    # Transforms are checked as strictly as when the points are loaded
+    ORIENTATIONS_err = ORIENTATIONS.copy()
+    ORIENTATIONS_err[0, 3, 3] = 1.0 + 1e-9
+
+    with pytest.raises(ValueError):
+        picks.from_numpy(POINTS, ORIENTATIONS_err)
+
+    # Write picks without transforms
+    picks.from_numpy(POINTS)
+    _, transforms = copick_run.get_picks(object_name="ribosome", user_id="gapstop", session_id="1")[0].numpy()
+    assert transforms == pytest.approx(np.tile(np.eye(4), (2, 1, 1))), "Transforms should default to identity."
+
+
+def test_picks_numpy_cached(test_payload: Dict[str, Any], monkeypatch):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    copick_run.new_picks(object_name="ribosome", user_id="cache", session_id="1").from_numpy(np.random.rand(5, 3))
+    picks = copick_run.get_picks(object_name="ribosome", user_id="cache", session_id="1")[0]
+
+    # Count the reads of the picks file
+    reads = []
+    load_json = picks._load_json
+    monkeypatch.setattr(picks, "_load_json", lambda: reads.append(1) or load_json())
+
+    # The file is read and parsed once, callers get their own copies
+    positions, _ = picks.numpy()
+    positions[:] = 0
+    positions2, _ = picks.numpy()
+    assert len(reads) == 1, "Picks file should be read once"
+    assert not np.all(positions2 == 0), "Cached arrays should not be modified by callers"
+
+    # Writing new points drops the cached arrays
+    new_positions = np.random.rand(3, 3)
+    picks.from_numpy(new_positions)
+    assert picks.numpy()[0] == pytest.approx(new_positions), "Cached arrays should be dropped on write"
+    assert len(reads) == 2, "Picks file should be read again after writing"
+
+
+def test_picks_write_nan(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    picks = copick_run.new_picks(object_name="ribosome", user_id="nan", session_id="1")
+
+    # Non-finite values are written as JSON constants, not as null
+    picks.points = [
+        CopickPoint(location=CopickLocation(x=np.nan, y=np.inf, z=1.0), score=np.nan),
+        CopickPoint(location=CopickLocation(x=1.0, y=2.0, z=-np.inf), score=0.5),
+    ]
+    picks.store()
+
+    # The file can be loaded again with the same values
+    picks = copick_run.get_picks(object_name="ribosome", user_id="nan", session_id="1")[0]
+    picks.load()
+    assert np.isnan(picks.points[0].location.x), "NaN location not read back"
+    assert picks.points[0].location.y == np.inf, "Infinite location not read back"
+    assert np.isnan(picks.points[0].score), "NaN score not read back"
+    assert picks.points[1].location.z == -np.inf, "Infinite location not read back"
+
 
 def test_run_get_meshes(test_payload: Dict[str, Any]):
     # Setup
@@ -1243,6 +1407,31 @@ def test_tomogram_zarr(test_payload: Dict[str, Any]):
     zarr.array(np.random.rand(64, 64, 64), store=tomo.zarr(), chunks=(32, 32, 32))
 
 
+def test_tomogram_zarr_read_only(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+    tomogram = vs.get_tomogram(tomo_type="denoised")
+
+    if not tomogram.read_only:
+        pytest.skip("Tomogram is not read-only.")
+
+    store = tomogram.zarr()
+    if is_local(tomogram.fs_static):
+        assert isinstance(store, MemoryMappedDirectoryStore), "Read-only local store should be memory-mapped."
+
+    # Check zarr is readable, but not writable
+    array = zarr.open(store, "r")["0"]
+    assert np.sum(array[:]) == pytest.approx(
+        8192.0,
+        abs=NUMERICAL_PRECISION,
+    ), "Error reading Zarr (incorrect sum)."
+
+    with pytest.raises(zarr.errors.ReadOnlyError):
+        store["test"] = b"test"
+
+
 def test_tomogram_read_numpy(test_payload: Dict[str, Any]):
     # Setup
     copick_root = test_payload["root"]
@@ -1267,6 +1456,76 @@ def test_tomogram_read_numpy(test_payload: Dict[str, Any]):
     ), "Error getting numpy array (incorrect sum)."
 
 
+def test_tomogram_read_data(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+    tomogram = vs.get_tomogram(tomo_type="denoised")
+
+    # Lazy array
+    array = tomogram.data()
+    assert isinstance(array, zarr.Array), "Error getting lazy array, (incorrect type)"
+    assert array.shape == (64, 64, 64), "Error getting lazy array, (incorrect shape)"
+
+    # Subregion
+    subregion = array[10:40, 50:60, 0:30]
+    assert subregion.shape == (30, 10, 30), "Error indexing lazy array, (incorrect shape)"
+    assert np.sum(subregion) == pytest.approx(
+        30.0,
+        abs=NUMERICAL_PRECISION,
+    ), "Error indexing lazy array (incorrect sum)."
+
+
+def test_tomogram_read_dtype(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+    tomogram = vs.new_tomogram(tomo_type="dtype")
+
+    array = np.random.rand(64, 64, 64).astype(np.float32)
+    tomogram.from_numpy(array, levels=1)
+    expected = array.astype(np.float16)
+
+    # Full array and subregion through numpy()
+    assert tomogram.numpy().dtype == np.float32, "Stored data type should be the default"
+    converted = tomogram.numpy(dtype="float16")
+    assert converted.dtype == np.float16, "Error converting numpy array (incorrect dtype)"
+    assert np.array_equal(converted, expected), "Error converting numpy array (incorrect values)"
+
+    converted = tomogram.numpy(x=slice(0, 30), y=slice(50, 60), z=slice(10, 40), dtype="float16")
+    assert converted.dtype == np.float16, "Error converting numpy subregion (incorrect dtype)"
+    assert np.array_equal(converted, expected[10:40, 50:60, 0:30]), "Error converting numpy subregion"
+
+    # Lazy array through data()
+    lazy = tomogram.data(dtype="float16")
+    assert lazy.dtype == np.float16, "Error converting lazy array (incorrect dtype)"
+    assert np.array_equal(lazy[10:40, 50:60, 0:30], expected[10:40, 50:60, 0:30]), "Error converting lazy array"
+
+
+def test_tomogram_extract_subvolumes(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+    tomogram = vs.get_tomogram(tomo_type="denoised")
+    array = tomogram.numpy()
+
+    # Points in angstrom (x, y, z), the last one partially outside the tomogram
+    points = np.array([[100.0, 200.0, 300.0], [320.0, 320.0, 320.0], [630.0, 50.0, 600.0]])
+    subvolumes = tomogram.extract_subvolumes(points, 8)
+    assert subvolumes.shape == (3, 8, 8, 8), "Error extracting subvolumes, (incorrect shape)"
+
+    # Fully contained subvolumes match direct slicing
+    assert np.array_equal(subvolumes[0], array[26:34, 16:24, 6:14]), "Error extracting subvolumes (incorrect data)"
+    assert np.array_equal(subvolumes[1], array[28:36, 28:36, 28:36]), "Error extracting subvolumes (incorrect data)"
+
+    # Parts outside the tomogram are zero-filled
+    assert np.array_equal(subvolumes[2][:, :, :5], array[56:64, 1:9, 59:64]), "Error extracting subvolumes"
+    assert np.all(subvolumes[2][:, :, 5:] == 0), "Error extracting subvolumes (incorrect padding)"
+
+
 def test_tomogram_write_numpy(test_payload: Dict[str, Any]):
     # Setup
     copick_root = test_payload["root"]
@@ -1295,6 +1554,312 @@ def test_tomogram_write_numpy(test_payload: Dict[str, Any]):
     assert np.allclose(franken_array, array2), "Error writing numpy array subregion"
 
 
+def test_tomogram_write_consolidated(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+    tomogram = vs.new_tomogram(tomo_type="test")
+
+    # Write numpy array
+    array = np.random.rand(64, 64, 64)
+    tomogram.from_numpy(array, levels=2)
+
+    # Check metadata is consolidated under the standard key
+    assert ".zmetadata" in metadata_store(tomogram.zarr()), "Metadata not consolidated"
+
+    group = open_group(tomogram.zarr())
+    assert isinstance(group.store, zarr.storage.ConsolidatedMetadataStore), "Consolidated metadata not used"
+    assert group["1"].shape == (32, 32, 32), "Error reading consolidated metadata"
+    assert np.allclose(array, tomogram.numpy()), "Error reading consolidated array"
+
+
+def test_tomogram_cached_group(test_payload: Dict[str, Any]):
+    # Setup
+    copick_root = test_payload["root"]
+    copick_run = copick_root.get_run("TS_001")
+    vs = copick_run.get_voxel_spacing(10.000)
+    tomogram = vs.new_tomogram(tomo_type="test")
+
+    # Write numpy array
+    array = np.random.rand(64, 64, 64)
+    tomogram.from_numpy(array, levels=2)
+
+    # Repeated reads reuse the opened group
+    assert tomogram.data("0").shape == (64, 64, 64), "Error reading data"
+    group = tomogram._group
+    assert tomogram.data("1").shape == (32, 32, 32), "Error reading data"
+    assert tomogram._group is group, "Opened group should be reused"
+
+    # Writing drops the cached group
+    tomogram.from_numpy(array[:32, :32, :32], levels=1)
+    assert tomogram._group is None, "Cached group should be dropped after writing"
+    assert tomogram.data("0").shape == (32, 32, 32), "Error reading rewritten data"
+
+
+def test_tomogram_remote_chunk_cache(tmp_path):
+    # Write a tomogram to an in-memory filesystem, which is treated as a remote store
+    objects = [{"name": "ribosome", "is_particle": True, "label": 1}]
+    writer = CopickRootFSSpec(
+        CopickConfigFSSpec(
+            config_type="filesystem",
+            name="remote",
+            pickable_objects=objects,
+            overlay_root="memory:///test_remote_chunk_cache/",
+        ),
+    )
+    volume = np.random.rand(64, 64, 64).astype(np.float32)
+    tomogram = writer.new_run("TS_001").new_voxel_spacing(10.000).new_tomogram("wbp")
+    write_ome_zarr_3d(tomogram.zarr(), {10.000: volume}, (32, 32, 32))
+
+    # Read it back as the static part of another project
+    reader = CopickRootFSSpec(
+        CopickConfigFSSpec(
+            config_type="filesystem",
+            name="remote",
+            pickable_objects=objects,
+            overlay_root=f"local://{tmp_path}/",
+            overlay_fs_args={"auto_mkdir": True},
+            static_root="memory:///test_remote_chunk_cache/",
+        ),
+    )
+    tomogram = reader.get_run("TS_001").get_voxel_spacing(10.000).get_tomograms("wbp")[0]
+    assert tomogram.read_only, "Tomogram should be read-only"
+
+    # Reads of remote stores go through the cache shared by all stores
+    copick.clear_config_cache()
+    hits, misses = chunk_cache.hits, chunk_cache.misses
+    assert isinstance(tomogram._open_group().chunk_store, CachedStore), "Remote store should be cached"
+
+    # The first read fetches every chunk, later reads are served from the cache, also for other entities
+    nchunks = tomogram.data().nchunks
+    assert np.array_equal(tomogram.numpy(), volume), "Incorrect data"
+    assert (chunk_cache.hits - hits, chunk_cache.misses - misses) == (0, nchunks), "All chunks should be fetched"
+
+    other = reader.get_run("TS_001").get_voxel_spacing(10.000).get_tomograms("wbp")[0]
+    other.refresh()
+    assert np.array_equal(other.numpy(), volume), "Incorrect data"
+    assert (chunk_cache.hits - hits, chunk_cache.misses - misses) == (nchunks, nchunks), "All chunks should be cached"
+    assert 0 < chunk_cache.size <= chunk_cache.max_size, "Incorrect cache size"
+
+    # Clearing the config cache frees the chunks
+    copick.clear_config_cache()
+    assert chunk_cache.size == 0, "Chunks should be freed"
+
+    # Stores can use their own cache, or none
+    store = tomogram.zarr(cache_size=1024**2)
+    assert isinstance(store, CachedStore) and store._cache is not chunk_cache, "Store should have its own cache"
+    assert np.array_equal(open_group(store)["0"][:], volume), "Incorrect data"
+    assert chunk_cache.size == 0, "Shared cache should not be used"
+    assert not isinstance(tomogram.zarr(cache_size=0), CachedStore), "Store should not be cached"
+
+
+def test_chunk_cache():
+    cache = ChunkCache(10)
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") == b"1234", "Cached value should be returned"
+
+    # The least recently used value is evicted to stay within the budget
+    cache.put("c", b"1234")
+    assert cache.get("b") is None, "Least recently used value should be evicted"
+    assert cache.get("a") == b"1234" and cache.get("c") == b"1234", "Recently used values should be kept"
+    assert cache.size == 8, "Incorrect cache size"
+
+    # Values larger than the budget are not cached
+    cache.put("d", b"12345678901")
+    assert cache.get("d") is None, "Oversized value should not be cached"
+    assert (cache.hits, cache.misses) == (3, 2), "Incorrect hit and miss counts"
+
+    cache.clear()
+    assert cache.size == 0 and cache.get("a") is None, "Cache should be empty"
+
+
+def test_auto_chunk_size():
+    # Largest isotropic chunks within the size target
+    assert auto_chunk_size((512, 512, 512), np.float32, 4 * 1024**2) == (101, 101, 101), "Incorrect chunk size"
+    assert auto_chunk_size((512, 512, 512), np.uint8, 4 * 1024**2) == (161, 161, 161), "Incorrect chunk size"
+    assert auto_chunk_size((512, 512, 512), np.float32, 16 * 1024**2) == (161, 161, 161), "Incorrect chunk size"
+    assert auto_chunk_size((512, 512, 512), np.uint8, 16 * 1024**2) == (256, 256, 256), "Incorrect chunk size"
+
+    # Clipped to the array shape
+    assert auto_chunk_size((200, 512, 30), np.uint8, 16 * 1024**2) == (200, 256, 30), "Incorrect chunk size"
+
+
+def test_volume_pyramid():
+    # The slab-wise pyramid matches downscaling the whole volume level by level, including odd shapes
+    for shape in [(64, 64, 64), (37, 20, 9), (1, 5, 5)]:
+        volume = np.random.rand(*shape)
+        pyramid = volume_pyramid(volume, 10.000, 3)
+        assert list(pyramid.keys()) == [10.000, 20.000, 40.000], "Incorrect voxel sizes"
+
+        expected = volume.astype(np.float32)
+        for level in pyramid.values():
+            assert np.array_equal(level, expected), f"Incorrect downscaling for shape {shape}"
+            expected = downscale_local_mean(expected, (2, 2, 2)).astype(np.float32)
+
+
+def test_segmentation_pyramid():
+    # The gathered pyramid matches nearest-neighbour rescaling level by level, including odd shapes
+    for shape in [(64, 64, 64), (37, 20, 9), (1, 5, 5), (3, 3, 3)]:
+        segmentation = np.random.randint(0, 5, shape)
+        pyramid = segmentation_pyramid(segmentation, 10.000, 3)
+        assert list(pyramid.keys()) == [10.000, 20.000, 40.000], "Incorrect voxel sizes"
+
+        expected = segmentation.astype(np.int8)
+        for level in pyramid.values():
+            assert level.dtype == np.int8, "Incorrect dtype"
+            assert np.array_equal(level, expected), f"Incorrect downsampling for shape {shape}"
+            expected = rescale(expected, (0.5, 0.5, 0.5), anti_aliasing=False, preserve_range=True, order=0)
+            expected = expected.astype(np.int8)
+
+
+def test_extract_subvolumes_kernels(monkeypatch):
+    # Centers in (x, y, z), including subvolumes reaching past every face of the array
+    coords = np.array([[0, 0, 0], [10, 15, 20], [19.2, 29, 39], [3, 25, 5]])
+    size = 9
+    scatter_kernel = extract._scatter_kernel
+
+    # Including dtypes numba can't compile, which fall back to numpy
+    for dtype in [np.float32, np.float16, np.dtype(">f4")]:
+        volume = np.random.rand(40, 30, 20).astype(dtype)
+        array = zarr.array(volume, chunks=(8, 8, 8))
+
+        padded = np.pad(volume, size)
+        expected = np.empty((len(coords), size, size, size), dtype=dtype)
+        for i, (x, y, z) in enumerate(np.round(coords).astype(int)):
+            lo = np.array([z, y, x]) - size // 2 + size
+            expected[i] = padded[lo[0] : lo[0] + size, lo[1] : lo[1] + size, lo[2] : lo[2] + size]
+
+        # The numpy fallback, the uncompiled numba kernel and the kernel chosen at runtime (compiled if numba is
+        # installed)
+        kernels = [extract._scatter_numpy, extract._scatter_loops, scatter_kernel.__wrapped__(array.dtype)]
+        for kernel in kernels:
+            monkeypatch.setattr(extract, "_scatter_kernel", lambda dtype, kernel=kernel: kernel)
+            subvolumes = extract.extract_subvolumes(array, coords, size)
+            assert np.array_equal(subvolumes, expected), f"Incorrect {dtype} subvolumes with {kernel}"
+
+
+def test_read_chunks_remote(tmp_path):
+    volume = np.random.rand(64, 64, 64).astype(np.float32)
+    fs = fsspec.filesystem("memory")
+    store = zarr.storage.FSStore("/test_read_chunks_remote", fs=fs, key_separator="/", dimension_separator="/")
+    write_ome_zarr_3d(store, {10.000: volume}, (16, 16, 16))
+
+    # Remote regions are fetched with one batched request for all chunks
+    store = read_only_store("/test_read_chunks_remote", fs, cache_size=0)
+    requests = []
+    getitems = store.getitems
+    store.getitems = lambda keys, **kwargs: requests.append(len(keys)) or getitems(keys, **kwargs)
+    region = read_chunks(open_group(store)["0"], (slice(0, 64), slice(8, 40)))
+    assert np.array_equal(region, volume[:, 8:40]), "Incorrect remote region"
+    assert requests == [4 * 3 * 4], "Remote chunks should be fetched with one request"
+
+    # Local regions are decoded in parallel
+    write_ome_zarr_3d(zarr.DirectoryStore(str(tmp_path), dimension_separator="/"), {10.000: volume}, (16, 16, 16))
+    array = open_group(read_only_store(str(tmp_path), fsspec.filesystem("file")))["0"]
+    region = read_chunks(array, (slice(3, 50), slice(0, 64), slice(17, 18)))
+    assert np.array_equal(region, volume[3:50, :, 17:18]), "Incorrect local region"
+
+
+def test_write_ome_zarr_chunk_size():
+    pyramid = {10.000: np.random.rand(16, 16, 16)}
+
+    # Valid chunk sizes are used as given
+    store = zarr.MemoryStore()
+    write_ome_zarr_3d(store, pyramid, (8, 8, 4))
+    assert zarr.open(store, "r")["0"].chunks == (8, 8, 4), "Incorrect chunk size"
+
+    # Chunks are clipped to the array shape
+    store = zarr.MemoryStore()
+    write_ome_zarr_3d(store, pyramid, (32, 8, 8))
+    assert zarr.open(store, "r")["0"].chunks == (16, 8, 8), "Chunk size not clipped to array shape"
+
+    # Malformed chunk sizes fail before anything is written
+    for chunk_size in [(8, 8), (8, 0, 8), (8, 8.5, 8)]:
+        with pytest.raises(ValueError):
+            write_ome_zarr_3d(zarr.MemoryStore(), pyramid, chunk_size)
+
+
+def test_write_ome_zarr_compressor():
+    pyramid = {10.000: np.random.rand(16, 16, 16)}
+
+    # Blosc LZ4 by default
+    store = zarr.MemoryStore()
+    write_ome_zarr_3d(store, pyramid)
+    compressor = zarr.open(store, "r")["0"].compressor
+    assert compressor.codec_id == "blosc" and compressor.cname == "lz4", "Incorrect default compressor"
+
+    # Compression can be disabled
+    store = zarr.MemoryStore()
+    write_ome_zarr_3d(store, pyramid, compressor=None)
+    array = zarr.open(store, "r")["0"]
+    assert array.compressor is None, "Compression should be disabled"
+    assert np.allclose(array[:], pyramid[10.000]), "Error reading uncompressed array"
+
+
+def test_write_ome_zarr_levels():
+    # The chunks of all levels are written by one pool, including partial edge chunks
+    pyramid = volume_pyramid(np.random.rand(37, 20, 9), 10.000, 3)
+
+    store = zarr.MemoryStore()
+    write_ome_zarr_3d(store, pyramid, (8, 8, 8), max_workers=3)
+    group = zarr.open(store, "r")
+    for level, array in enumerate(pyramid.values()):
+        assert np.array_equal(group[str(level)][:], array), f"Incorrect data at level {level}"
+
+
+def test_kvstore_spec(tmp_path):
+    # Local stores map to the file driver
+    store = MemoryMappedDirectoryStore(str(tmp_path))
+    assert kvstore_spec(store) == {"driver": "file", "path": f"{tmp_path}/"}, "Incorrect spec for local store"
+
+    # Anonymous S3 stores map to the s3 driver, also when wrapped in a chunk cache
+    fs = s3fs.S3FileSystem(anon=True)
+    store = zarr.storage.FSStore("bucket/project/tomogram.zarr", fs=fs, mode="r", create=False)
+    expected = {
+        "driver": "s3",
+        "bucket": "bucket",
+        "path": "project/tomogram.zarr/",
+        "aws_credentials": {"type": "anonymous"},
+    }
+    assert kvstore_spec(store) == expected, "Incorrect spec for S3 store"
+    assert kvstore_spec(zarr.storage.LRUStoreCache(store, max_size=1024)) == expected, "Incorrect spec for cached store"
+
+    # Endpoint, region and requester pays settings are forwarded
+    fs = s3fs.S3FileSystem(
+        anon=True,
+        endpoint_url="http://127.0.0.1:4001",
+        client_kwargs={"region_name": "us-west-2"},
+        requester_pays=True,
+    )
+    store = zarr.storage.FSStore("bucket/project/tomogram.zarr", fs=fs, mode="r", create=False)
+    expected = {
+        "driver": "s3",
+        "bucket": "bucket",
+        "path": "project/tomogram.zarr/",
+        "endpoint": "http://127.0.0.1:4001",
+        "region": "us-west-2",
+        "requester_pays": True,
+        "aws_credentials": {"type": "anonymous"},
+    }
+    assert kvstore_spec(store) == expected, "Incorrect spec for S3 store with endpoint"
+
+    # Settings that can not be expressed in a spec are rejected
+    for fs_args in [
+        {"key": "test", "secret": "test", "endpoint_url": "http://127.0.0.1:4001"},
+        {"anon": True, "config_kwargs": {"max_pool_connections": 5}},
+    ]:
+        fs = s3fs.S3FileSystem(**fs_args)
+        store = zarr.storage.FSStore("bucket/project/tomogram.zarr", fs=fs, mode="r", create=False)
+        with pytest.raises(ValueError):
+            kvstore_spec(store)
+
+    # Other stores are rejected
+    with pytest.raises(ValueError):
+        kvstore_spec(zarr.MemoryStore())
+
+
 def test_feature_meta(test_payload: Dict[str, Any]):
     # Setup
     copick_root = test_payload["root"]